@@ -1,9 +1,30 @@
 """Metrics panel component for displaying session metrics."""
 
+import html
+import pandas as pd
 import streamlit as st
 from typing import Any
 
 
+def _metric_tiles(tiles: list[tuple[str, Any]]) -> str:
+    """Build an HTML row of metric tiles.
+
+    Args:
+        tiles: (label, value) pairs in display order
+
+    Returns:
+        HTML string styled like a row of st.metric widgets
+    """
+    cells = "".join(
+        '<div style="flex:1;min-width:6rem">'
+        f'<div style="font-size:0.875rem;opacity:0.6">{html.escape(str(label))}</div>'
+        f'<div style="font-size:1.75rem">{html.escape(str(value))}</div>'
+        '</div>'
+        for label, value in tiles
+    )
+    return f'<div style="display:flex;gap:1rem;margin-bottom:1rem">{cells}</div>'
+
+
 def display_session_metrics(metrics: dict[str, Any]) -> None:
     """Display metrics for the current session.
 
@@ -18,36 +39,42 @@ def display_session_metrics(metrics: dict[str, Any]) -> None:
 
     # Overall session metrics
     st.markdown("### Overall")
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Total Requests", metrics.get('total_requests', 0))
-    with col2:
-        st.metric("Total Tokens", metrics.get('total_tokens', 0))
-    with col3:
-        tokens_in = metrics.get('total_tokens_in', 0)
-        tokens_out = metrics.get('total_tokens_out', 0)
-        if tokens_in + tokens_out > 0:
-            ratio = tokens_out / (tokens_in + tokens_out) * 100
-            st.metric("Output Ratio", f"{ratio:.1f}%")
-
-    # Agent-specific metrics
+    overall = [
+        ("Total Requests", metrics.get('total_requests', 0)),
+        ("Total Tokens", metrics.get('total_tokens', 0)),
+    ]
+    ratio = metrics.get('output_ratio')
+    if ratio is not None:
+        overall.append(("Output Ratio", f"{ratio:.1f}%"))
+    st.markdown(_metric_tiles(overall), unsafe_allow_html=True)
+
+    # Agent-specific metrics, one HTML block per agent
     agents = metrics.get('agents', {})
     if agents:
         st.markdown("### By Agent")
 
         for agent_name, agent_metrics in agents.items():
             with st.expander(f"🤖 {agent_name}", expanded=True):
-                col1, col2, col3, col4 = st.columns(4)
+                st.markdown(_metric_tiles([
+                    ("Calls", agent_metrics.get('total_calls', 0)),
+                    ("Avg Duration", f"{agent_metrics.get('avg_duration_ms', 0):.0f}ms"),
+                    ("Total Tokens", agent_metrics.get('total_tokens', 0)),
+                    ("Errors", agent_metrics.get('error_count', 0)),
+                ]), unsafe_allow_html=True)
+
 
-                with col1:
-                    st.metric("Calls", agent_metrics.get('total_calls', 0))
-                with col2:
-                    st.metric("Avg Duration", f"{agent_metrics.get('avg_duration_ms', 0):.0f}ms")
-                with col3:
-                    st.metric("Total Tokens", agent_metrics.get('total_tokens', 0))
-                with col4:
-                    st.metric("Errors", agent_metrics.get('error_count', 0))
+@st.cache_data
+def _token_df(items: tuple[tuple[str, int], ...]) -> pd.DataFrame:
+    """Build the agent/token DataFrame for a metrics snapshot.
+
+    Args:
+        items: Hashable (agent_name, total_tokens) pairs
+
+    Returns:
+        DataFrame indexed by agent name, ready for st.bar_chart
+    """
+    df = pd.DataFrame(items, columns=['Agent', 'Tokens'])
+    return df.set_index('Agent')
 
 
 def display_token_breakdown(metrics: dict[str, Any]) -> None:
@@ -62,23 +89,14 @@ def display_token_breakdown(metrics: dict[str, Any]) -> None:
 
     st.subheader("Token Distribution")
 
-    # Create data for visualization
-    agent_names = []
-    token_counts = []
-
-    for agent_name, agent_metrics in agents.items():
-        agent_names.append(agent_name)
-        token_counts.append(agent_metrics.get('total_tokens', 0))
+    # Snapshot as a hashable key so the DataFrame is only rebuilt on change
+    items = tuple(sorted(
+        (agent_name, agent_metrics.get('total_tokens', 0))
+        for agent_name, agent_metrics in agents.items()
+    ))
 
     # Display as bar chart
-    if token_counts and sum(token_counts) > 0:
-        import pandas as pd
-
-        df = pd.DataFrame({
-            'Agent': agent_names,
-            'Tokens': token_counts
-        })
-
-        st.bar_chart(df.set_index('Agent'))
+    if items and sum(tokens for _, tokens in items) > 0:
+        st.bar_chart(_token_df(items))
     else:
         st.info("No token data available yet.")
@@ -1,95 +1,163 @@
 """Trace viewer component for displaying execution traces."""
 
+import math
+import pandas as pd
 import streamlit as st
 from typing import Any
 
+# Number of traces rendered per page in the summary view
+TRACE_PAGE_SIZE = 5
+
+# Per-trace summary columns shown above the event timeline
+_SUMMARY_COLUMNS = [
+    'trace_id', 'event_count', 'duration_ms',
+    'total_tokens_in', 'total_tokens_out', 'total_tokens'
+]
+
+# Icon shown next to each trace event type
+_EVENT_ICONS: dict[str, str] = {
+    "agent_start": "🚀",
+    "agent_end": "✅",
+    "tool_call": "🔧",
+    "tool_result": "📊",
+    "llm_request": "💬",
+    "llm_response": "🤖",
+    "routing_decision": "🧭",
+    "memory_read": "📖",
+    "memory_write": "📝",
+    "error": "❌"
+}
+
+
+@st.cache_data
+def _summarize_traces(traces: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the per-trace summary table in one columnar pass.
+
+    Args:
+        traces: List of trace dictionaries
+
+    Returns:
+        DataFrame with one row per trace and missing durations filled with 0
+    """
+    df = pd.DataFrame(traces, columns=_SUMMARY_COLUMNS)
+    df['duration_ms'] = df['duration_ms'].fillna(0)
+    return df
 
-def display_trace(trace: dict[str, Any]) -> None:
-    """Display an execution trace with all events.
+
+def display_trace(trace: dict[str, Any], summary: Any | None = None) -> None:
+    """Display an execution trace, rendering its events only when opened.
 
     Args:
         trace: Trace dictionary from the tracer
+        summary: Optional precomputed summary row from _summarize_traces
     """
-    with st.expander(f"🔍 Trace: {trace['trace_id'][:8]}... ({trace['event_count']} events)", expanded=False):
+    # Body is only built for traces the user has opened; the checkbox state
+    # persists across reruns via its key
+    label = f"🔍 Trace: {trace['trace_id'][:8]}... ({trace['event_count']} events)"
+    if not st.checkbox(label, key=f"open_{trace['trace_id']}"):
+        return
+
+    if summary is None:
+        summary = _summarize_traces([trace]).iloc[0]
+
+    with st.container(border=True):
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Duration", f"{trace.get('duration_ms', 0):.0f}ms")
+            st.metric("Duration", f"{summary.duration_ms:.0f}ms")
         with col2:
-            st.metric("Tokens In", trace['total_tokens_in'])
+            st.metric("Tokens In", int(summary.total_tokens_in))
         with col3:
-            st.metric("Tokens Out", trace['total_tokens_out'])
+            st.metric("Tokens Out", int(summary.total_tokens_out))
         with col4:
-            st.metric("Total Tokens", trace['total_tokens'])
+            st.metric("Total Tokens", int(summary.total_tokens))
 
-        # Event timeline
+        # Event timeline, rendered as a single markdown block
         st.subheader("Event Timeline")
-        for event in trace['events']:
-            _display_event(event)
+        events = trace['events']
+        st.markdown("\n\n".join(_format_event(event) for event in events))
+
+        # Raw payloads for events that carry structured data
+        details = [
+            {"event": f"{event['event_type']} - {event['agent_name']}", "data": payload}
+            for event in events
+            if (payload := _event_payload(event)) is not None
+        ]
+        if details:
+            with st.expander("Event Data", expanded=False):
+                st.json(details)
+
+
+def _render_tool_call(data: dict[str, Any]) -> list[str]:
+    """Detail lines for a tool_call event."""
+    return [f":gray[🔧 {data.get('tool', 'unknown')}]"]
+
+
+def _render_routing_decision(data: dict[str, Any]) -> list[str]:
+    """Detail lines for a routing_decision event."""
+    lines = [f":gray[➡️ Routing to: {data.get('target_agent', 'unknown')}]"]
+    if 'reason' in data:
+        lines.append(f":gray[Reason: {data['reason']}]")
+    return lines
 
 
-def _display_event(event: dict[str, Any]) -> None:
-    """Display a single trace event.
+def _render_llm(data: dict[str, Any]) -> list[str]:
+    """Detail lines for llm_request / llm_response events."""
+    return [f":gray[Tokens: {data.get('tokens_in', 0)} in, {data.get('tokens_out', 0)} out]"]
+
+
+# Compact detail renderers by event type; other event types show their raw
+# data in the Event Data expander instead
+_RENDERERS = {
+    "tool_call": _render_tool_call,
+    "routing_decision": _render_routing_decision,
+    "llm_request": _render_llm,
+    "llm_response": _render_llm,
+}
+
+
+def _format_event(event: dict[str, Any]) -> str:
+    """Format a single trace event as markdown.
 
     Args:
         event: Event dictionary
+
+    Returns:
+        Markdown string for the event
     """
-    event_type = event['event_type']
-    agent_name = event['agent_name']
-    data = event['data']
-
-    # Choose icon based on event type
-    icon = _get_event_icon(event_type)
-
-    # Format duration if present
-    duration_str = ""
-    if event.get('duration_ms'):
-        duration_str = f" ({event['duration_ms']:.0f}ms)"
-
-    # Display event
-    with st.container():
-        st.markdown(f"{icon} **{event_type}** - {agent_name}{duration_str}")
-
-        # Show event data in a compact format
-        if data:
-            if event_type == "tool_call":
-                st.caption(f"🔧 {data.get('tool', 'unknown')}")
-                if 'input' in data:
-                    with st.expander("Tool Input", expanded=False):
-                        st.json(data['input'])
-            elif event_type == "routing_decision":
-                st.caption(f"➡️ Routing to: {data.get('target_agent', 'unknown')}")
-                if 'reason' in data:
-                    st.caption(f"Reason: {data['reason']}")
-            elif event_type in ["llm_request", "llm_response"]:
-                st.caption(f"Tokens: {data.get('tokens_in', 0)} in, {data.get('tokens_out', 0)} out")
-            else:
-                with st.expander("Event Data", expanded=False):
-                    st.json(data)
-
-
-def _get_event_icon(event_type: str) -> str:
-    """Get icon for event type.
+    event_type, agent_name, data, duration_ms = (
+        event['event_type'], event['agent_name'], event['data'], event.get('duration_ms')
+    )
+
+    icon = _EVENT_ICONS.get(event_type, "•")
+    duration_str = f" ({duration_ms:.0f}ms)" if duration_ms else ""
+    header = f"{icon} **{event_type}** - {agent_name}{duration_str}"
+
+    # Show event data in a compact format
+    renderer = _RENDERERS.get(event_type)
+    if not data or renderer is None:
+        return header
+    return "  \n".join([header, *renderer(data)])
+
+
+def _event_payload(event: dict[str, Any]) -> Any:
+    """Get the structured payload worth showing for an event, if any.
 
     Args:
-        event_type: Type of event
+        event: Event dictionary
 
     Returns:
-        Icon string
+        Tool input for tool calls, raw data for uncategorized events, else None
     """
-    icons = {
-        "agent_start": "🚀",
-        "agent_end": "✅",
-        "tool_call": "🔧",
-        "tool_result": "📊",
-        "llm_request": "💬",
-        "llm_response": "🤖",
-        "routing_decision": "🧭",
-        "memory_read": "📖",
-        "memory_write": "📝",
-        "error": "❌"
-    }
-    return icons.get(event_type, "•")
+    event_type, data = event['event_type'], event['data']
+
+    if not data:
+        return None
+    if event_type == "tool_call":
+        return data.get('input')
+    if event_type in _RENDERERS:
+        return None
+    return data
 
 
 def display_trace_summary(traces: list[dict[str, Any]]) -> None:
@@ -104,5 +172,15 @@ def display_trace_summary(traces: list[dict[str, Any]]) -> None:
 
     st.subheader("Recent Traces")
 
-    for trace in traces:
-        display_trace(trace)
+    # Only build widgets for the visible page of traces
+    page_count = math.ceil(len(traces) / TRACE_PAGE_SIZE)
+    page = 1
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+
+    start = (page - 1) * TRACE_PAGE_SIZE
+    visible = traces[start:start + TRACE_PAGE_SIZE]
+    summaries = _summarize_traces(visible)
+
+    for trace, summary in zip(visible, summaries.itertuples(index=False)):
+        display_trace(trace, summary)
@@ -25,6 +25,19 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+@st.cache_resource
+def get_orchestrator() -> AgentOrchestrator:
+    """Shared orchestrator for all browser sessions.
+
+    Per-session state (conversation history, metrics) is already keyed by
+    session_id inside the orchestrator, so one instance can serve everyone.
+    """
+    return AgentOrchestrator()
+
+
+orchestrator = get_orchestrator()
+
 # Initialize session state
 if "session_id" not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4())
@@ -32,12 +45,42 @@ if "session_id" not in st.session_state:
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-if "orchestrator" not in st.session_state:
-    st.session_state.orchestrator = AgentOrchestrator()
+# Markdown of all completed messages, grown as messages are added
+if "rendered_history_md" not in st.session_state:
+    st.session_state.rendered_history_md = ""
 
 if "show_observability" not in st.session_state:
     st.session_state.show_observability = False
 
+# Bumped whenever a chat turn completes so cached observability data refreshes
+if "metrics_version" not in st.session_state:
+    st.session_state.metrics_version = 0
+
+
+def _append_message(role: str, content: str, metadata: dict | None = None) -> None:
+    """Record a chat message and fold it into the rendered history markdown."""
+    st.session_state.messages.append({"role": role, "content": content, "metadata": metadata})
+
+    entry = f"**{role.title()}:** {content}"
+    if metadata and metadata.get("routed"):
+        entry += f"\n\n:gray[🧭 Routed to: {metadata.get('target_agent', 'unknown')}]"
+
+    separator = "\n\n---\n\n" if st.session_state.rendered_history_md else ""
+    st.session_state.rendered_history_md += separator + entry
+
+
+@st.cache_data(ttl=2)
+def _cached_metrics(_orchestrator: AgentOrchestrator, session_id: str, version: int) -> dict:
+    """Session metrics, cached briefly so idle reruns skip re-aggregation."""
+    return _orchestrator.get_session_metrics(session_id)
+
+
+@st.cache_data(ttl=2)
+def _cached_traces(_orchestrator: AgentOrchestrator, limit: int, version: int) -> list[dict]:
+    """Recent traces, cached briefly so idle reruns skip span conversion."""
+    return _orchestrator.get_recent_traces(limit=limit)
+
+
 # Main title
 st.title("🎵 Artist-Venue Matching Agent")
 st.caption("Powered by Claude Multi-Agent System • Connecting artists with venues")
@@ -91,8 +134,10 @@ with st.sidebar:
     st.caption(f"ID: {st.session_state.session_id[:8]}...")
 
     if st.button("🗑️ Clear Chat History", use_container_width=True):
-        st.session_state.orchestrator.clear_session(st.session_state.session_id)
+        orchestrator.clear_session(st.session_state.session_id)
         st.session_state.messages = []
+        st.session_state.rendered_history_md = ""
+        st.session_state.metrics_version += 1
         st.rerun()
 
     st.caption(f"Messages: {len(st.session_state.messages)}")
@@ -114,40 +159,12 @@ else:
     chat_container = st.container()
     obs_container = None
 
-# Display chat messages
-with chat_container:
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-
-            # Show metadata if available
-            if message.get("metadata"):
-                metadata = message["metadata"]
-                if metadata.get("routed"):
-                    st.caption(f"🧭 Routed to: {metadata.get('target_agent', 'unknown')}")
-
-# Display observability if enabled
-if st.session_state.show_observability and obs_container:
-    with obs_container:
-        tab1, tab2 = st.tabs(["📊 Metrics", "🔍 Traces"])
-
-        with tab1:
-            metrics = st.session_state.orchestrator.get_session_metrics(st.session_state.session_id)
-            display_session_metrics(metrics)
-
-            if metrics:
-                st.divider()
-                display_token_breakdown(metrics)
-
-        with tab2:
-            traces = st.session_state.orchestrator.get_recent_traces(limit=5)
-            display_trace_summary(traces)
+# Display chat history as a single markdown block
+if st.session_state.rendered_history_md:
+    chat_container.markdown(st.session_state.rendered_history_md)
 
 # Chat input
 if user_input := st.chat_input("Ask me to find venues or artists..."):
-    # Add user message to chat
-    st.session_state.messages.append({"role": "user", "content": user_input})
-
     # Display user message immediately
     with chat_container:
         with st.chat_message("user"):
@@ -156,15 +173,24 @@ if user_input := st.chat_input("Ask me to find venues or artists..."):
     # Process through orchestrator
     with chat_container:
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                result = st.session_state.orchestrator.process_message(
-                    user_input,
-                    st.session_state.session_id,
-                    user_id=None  # Could add user authentication here
-                )
-
-            # Display response
-            st.markdown(result["content"])
+            # Stream the response as it is generated
+            stream = orchestrator.process_message_stream(
+                user_input,
+                st.session_state.session_id,
+                user_id=None  # Could add user authentication here
+            )
+            placeholder = st.empty()
+            shown = ""
+            for chunk in stream:
+                shown = "" if chunk is None else shown + chunk
+                placeholder.markdown(shown + "▌")
+
+            # The streamed text may include drafts that preceded tool use;
+            # show and store the final response, as conversation memory does
+            result = stream.result
+            content = result["content"]
+            placeholder.markdown(content)
+            st.session_state.metrics_version += 1
 
             # Show metadata
             metadata = result.get("metadata", {})
@@ -176,16 +202,35 @@ if user_input := st.chat_input("Ask me to find venues or artists..."):
             if tokens.get("total", 0) > 0:
                 st.caption(f"💬 Tokens: {tokens['in']} in, {tokens['out']} out ({tokens['total']} total)")
 
-    # Add assistant message to chat history
-    st.session_state.messages.append({
-        "role": "assistant",
-        "content": result["content"],
-        "metadata": metadata
-    })
+    # Fold the completed turn into chat history
+    _append_message("user", user_input)
+    _append_message("assistant", content, metadata)
 
-    # Rerun to update observability panel
-    if st.session_state.show_observability:
-        st.rerun()
+# Display observability if enabled. Rendered after the chat turn so the
+# panel already reflects the latest message without a full script rerun.
+if st.session_state.show_observability and obs_container:
+    with obs_container:
+        tab1, tab2 = st.tabs(["📊 Metrics", "🔍 Traces"])
+
+        with tab1:
+            metrics = _cached_metrics(
+                orchestrator,
+                st.session_state.session_id,
+                st.session_state.metrics_version
+            )
+            display_session_metrics(metrics)
+
+            if metrics:
+                st.divider()
+                display_token_breakdown(metrics)
+
+        with tab2:
+            traces = _cached_traces(
+                orchestrator,
+                5,
+                st.session_state.metrics_version
+            )
+            display_trace_summary(traces)
 
 # Footer
 st.divider()
@@ -1,7 +1,7 @@
 """MCP server for Booker artist-venue matching tools."""
 
 import asyncio
-import json
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -16,16 +16,37 @@ from src.tools.schemas import (
 )
 
 
+# Converted tools keyed by tool name (schema dicts are not hashable)
+_TOOL_CACHE: dict[str, Tool] = {}
+
+
 def convert_schema_to_mcp(tool_schema: dict) -> Tool:
     """Convert our tool schema format to MCP Tool format.
 
     Our schemas use "input_schema" but MCP uses "inputSchema".
+    Results are memoized by tool name.
     """
-    return Tool(
-        name=tool_schema["name"],
-        description=tool_schema["description"],
-        inputSchema=tool_schema["input_schema"]
+    name = tool_schema["name"]
+    tool = _TOOL_CACHE.get(name)
+    if tool is None:
+        tool = _TOOL_CACHE[name] = Tool(
+            name=name,
+            description=tool_schema["description"],
+            inputSchema=tool_schema["input_schema"]
+        )
+    return tool
+
+
+# Tool list is built once; the schemas are static module-level constants
+_TOOLS: tuple[Tool, ...] = tuple(
+    convert_schema_to_mcp(schema)
+    for schema in (
+        SEARCH_ARTISTS_SCHEMA,
+        SEARCH_VENUES_SCHEMA,
+        GET_ARTIST_DETAILS_SCHEMA,
+        GET_VENUE_DETAILS_SCHEMA
     )
+)
 
 
 # Create the MCP server
@@ -35,12 +56,7 @@ server = Server("booker")
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """Return list of available Booker tools."""
-    return [
-        convert_schema_to_mcp(SEARCH_ARTISTS_SCHEMA),
-        convert_schema_to_mcp(SEARCH_VENUES_SCHEMA),
-        convert_schema_to_mcp(GET_ARTIST_DETAILS_SCHEMA),
-        convert_schema_to_mcp(GET_VENUE_DETAILS_SCHEMA)
-    ]
+    return list(_TOOLS)
 
 
 @server.call_tool()
@@ -49,13 +65,14 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
     This routes to the existing execute_tool() function in registry.py.
     """
-    # Execute the tool using existing infrastructure
-    result = execute_tool(name, arguments)
+    # Run the blocking tool call off the event loop so concurrent
+    # requests on the stdio transport are not stalled
+    result = await asyncio.to_thread(execute_tool, name, arguments)
 
-    # Return result as JSON-formatted text
+    # Return result as compact JSON text
     return [TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=orjson.dumps(result).decode()
     )]
 
 
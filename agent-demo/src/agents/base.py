@@ -1,17 +1,66 @@
 """Base agent class for all agents."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Iterator
+import httpx
 from anthropic import Anthropic
 
 from src.config.settings import settings
 from src.observability.tracer import tracer
 from src.observability.logger import get_logger
+from src.observability.llm_cache import llm_cache, make_cache_key
 from src.models.trace import TraceEventType
-
-
-@dataclass
+from src.tools.registry import bind_tool, project_tool_result
+from src.tools.toon import encode_tool_result
+
+# Shared pool for running independent tool calls from one LLM response
+_tool_executor = ThreadPoolExecutor(
+    max_workers=settings.tool_concurrency_limit,
+    thread_name_prefix="agent-tool"
+)
+
+# One keep-alive HTTP/2 connection pool shared by every agent's Anthropic
+# client, so agents after the first skip the TLS handshake
+_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(60.0, connect=5.0)
+)
+
+# Marks a prompt-cache breakpoint on a system, tool or message block
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Receives generated text deltas while set; None means non-streaming calls
+_text_sink: ContextVar[Callable[[str | None], None] | None] = ContextVar("text_sink", default=None)
+
+
+@contextmanager
+def stream_text(callback: Callable[[str | None], None]) -> Iterator[None]:
+    """Stream LLM text deltas to a callback for calls made inside this block.
+
+    Only the final response is meant for the user. Text from a call that ends
+    in tool use (a routing decision or an intermediate tool-loop step) is
+    streamed as it arrives, then retracted by calling the callback with None
+    once the stop reason is known; consumers should discard the text received
+    since the previous None.
+
+    Args:
+        callback: Called with each text delta as it is generated, or with
+            None when the text streamed so far is superseded
+    """
+    token = _text_sink.set(callback)
+    try:
+        yield
+    finally:
+        _text_sink.reset(token)
+
+
+@dataclass(slots=True, frozen=True)
 class AgentResponse:
     """Response from an agent execution."""
     content: str
@@ -26,6 +75,53 @@ class AgentResponse:
         return self.tokens_in + self.tokens_out
 
 
+def _with_cache_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the latest tool results as a prompt-cache breakpoint.
+
+    Only the most recent user turn is marked so the request stays within the
+    API's breakpoint limit; earlier turns are covered by the cached prefix.
+    The input list and its messages are not mutated.
+
+    Args:
+        messages: List of messages in Anthropic API format
+
+    Returns:
+        Messages with a cache breakpoint on the last block of the last turn
+    """
+    last = messages[-1] if messages else None
+    if not last or last["role"] != "user" or not isinstance(last["content"], list) or not last["content"]:
+        return messages
+
+    blocks = [*last["content"][:-1], {**last["content"][-1], "cache_control": _CACHE_CONTROL}]
+    return [*messages[:-1], {**last, "content": blocks}]
+
+
+def _trim_history(history: list[dict[str, Any]], limit: int) -> list[dict[str, Any]]:
+    """Cap conversation history at limit messages with a stable prefix.
+
+    The opening exchange is always kept. Older messages after it are dropped
+    in fixed-size, even-length blocks rather than one per turn, so the kept
+    prefix (and its prompt-cache entry) only changes once per block and the
+    user/assistant alternation is preserved.
+
+    Args:
+        history: Conversation history in Anthropic API format
+        limit: Maximum number of messages to keep
+
+    Returns:
+        History with at most limit messages
+    """
+    if len(history) <= limit:
+        return history
+    if limit < 4:
+        return history[len(history) - limit:] if limit > 0 else []
+
+    step = max(2, (limit - 2) // 4 * 2)
+    excess = len(history) - limit
+    dropped = -(-excess // step) * step
+    return [*history[:2], *history[2 + dropped:]]
+
+
 class BaseAgent(ABC):
     """Abstract base class for all agents."""
 
@@ -42,14 +138,44 @@ class BaseAgent(ABC):
             name: Agent name for logging/tracing
             system_prompt: System prompt defining agent behavior
             tools: List of tool schemas available to this agent
-            client: Anthropic client (creates new one if not provided)
+            client: Anthropic client (creates one on the shared connection
+                pool if not provided)
         """
         self.name = name
         self.system_prompt = system_prompt
         self.tools = tools or []
-        self.client = client or Anthropic(api_key=settings.anthropic_api_key)
+        self.client = client or Anthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=_http_client
+        )
         self.logger = get_logger(f"agent.{name}")
 
+        # Tool callables resolved once, keyed by the names the model can call
+        self._tool_dispatch: dict[str, Callable[[dict[str, Any]], Any]] = {
+            schema["name"]: bind_tool(schema["name"]) for schema in self.tools
+        }
+
+        # Per-call limits, read once instead of on every request
+        self._max_iterations = settings.max_agent_iterations
+        self._history_limit = settings.conversation_history_limit
+
+        # Request parameters that are fixed for the agent's lifetime. The
+        # system prompt and the last tool schema carry prompt-cache
+        # breakpoints so the whole prefix is served from Anthropic's prompt
+        # cache on repeat calls.
+        self._base_api_params: dict[str, Any] = {
+            "model": settings.default_model,
+            "max_tokens": settings.max_tokens,
+            "system": [
+                {"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}
+            ]
+        }
+        if self.tools:
+            self._base_api_params["tools"] = [
+                *self.tools[:-1],
+                {**self.tools[-1], "cache_control": _CACHE_CONTROL}
+            ]
+
     @abstractmethod
     def process(
         self,
@@ -69,61 +195,312 @@ class BaseAgent(ABC):
         """
         pass
 
-    def _call_llm(self, messages: list[dict[str, Any]]) -> tuple[Any, int, int]:
+    async def aprocess(
+        self,
+        user_message: str,
+        context: dict[str, Any] | None = None,
+        conversation_history: list[dict[str, str]] | None = None
+    ) -> AgentResponse:
+        """Awaitable process() for dispatching several agents concurrently.
+
+        The agent runs on a worker thread with the caller's context copied in,
+        so the active trace span and stream_text() callback still apply and
+        callers can asyncio.gather() independent agents.
+
+        Args:
+            user_message: The user's input message
+            context: Optional context (preferences, intermediate results, etc.)
+            conversation_history: Optional conversation history
+
+        Returns:
+            AgentResponse with content and metadata
+        """
+        return await asyncio.to_thread(self.process, user_message, context, conversation_history)
+
+    def _run_tool_loop(
+        self,
+        user_message: str,
+        context: dict[str, Any] | None = None,
+        conversation_history: list[dict[str, str]] | None = None
+    ) -> AgentResponse:
+        """Run the LLM/tool loop until the model stops calling tools.
+
+        Shared by the tool-using agents; each one differs only in its
+        prompt and tool set.
+
+        Args:
+            user_message: The user's input message
+            context: Optional context (preferences, intermediate results, etc.)
+            conversation_history: Optional conversation history
+
+        Returns:
+            AgentResponse with the final text and accumulated token counts
+        """
+        label = self.name.replace("_", " ")
+
+        if tracer.enabled:
+            tracer.record_event(
+                TraceEventType.AGENT_START.value,
+                self.name,
+                {"query": user_message}
+            )
+
+        self.logger.info(f"Processing {label} request", query_length=len(user_message))
+
+        messages = self._build_messages(user_message, context, conversation_history)
+        total_tokens_in, total_tokens_out = 0, 0
+
+        # Agent loop with tool use
+        for iteration in range(self._max_iterations):
+            self.logger.debug(f"Iteration {iteration + 1}", iteration=iteration + 1)
+
+            # Tools start running as soon as their blocks finish streaming
+            started_tools: dict[str, Future] = {}
+            response, tokens_in, tokens_out = self._call_llm(messages, started_tools)
+            total_tokens_in += tokens_in
+            total_tokens_out += tokens_out
+
+            # The stop reason says whether tools were requested without
+            # scanning the content blocks
+            if response.stop_reason != "tool_use":
+                break
+
+            # Collect tool calls in a single pass over the content
+            _, tool_calls = self._partition_content(response)
+
+            # Add assistant message with tool calls to history
+            messages.append({"role": "assistant", "content": response.content})
+
+            # Execute tools and collect results
+            results = self._execute_tools(tool_calls, started_tools)
+            tool_results = []
+            for tc, content in zip(tool_calls, results):
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": tc["id"],
+                    "content": content
+                })
+
+            # Add tool results to messages
+            messages.append({"role": "user", "content": tool_results})
+
+        if tracer.enabled:
+            tracer.record_event(
+                TraceEventType.AGENT_END.value,
+                self.name,
+                {"iterations": iteration + 1, "total_tokens": total_tokens_in + total_tokens_out}
+            )
+
+        self.logger.info(
+            f"Completed {label}",
+            iterations=iteration + 1,
+            total_tokens=total_tokens_in + total_tokens_out
+        )
+
+        return AgentResponse(
+            content=self._extract_text_response(response),
+            tokens_in=total_tokens_in,
+            tokens_out=total_tokens_out,
+            metadata={"iterations": iteration + 1}
+        )
+
+    def _call_llm(
+        self,
+        messages: list[dict[str, Any]],
+        started_tools: dict[str, Future] | None = None
+    ) -> tuple[Any, int, int]:
         """Call the LLM and return response with token counts.
 
+        The response is streamed. Text deltas go to the active stream_text()
+        callback, if any. When started_tools is given, each tool_use block is
+        submitted to the tool pool as soon as it finishes streaming, so tools
+        run while the model is still generating later blocks.
+
         Args:
             messages: List of messages in Anthropic API format
+            started_tools: Optional dict filled with tool futures by tool_use id
 
         Returns:
             Tuple of (response, tokens_in, tokens_out)
         """
+        cache_key = None
+        if settings.enable_llm_cache:
+            cache_key = make_cache_key(
+                self._base_api_params["model"],
+                self._base_api_params["max_tokens"],
+                self.system_prompt,
+                self.tools,
+                messages
+            )
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return self._replay_cached_response(cached)
+
         with tracer.timed_event(
             TraceEventType.LLM_REQUEST.value,
             self.name,
             {
                 "message_count": len(messages),
                 "has_tools": bool(self.tools),
-                "model": settings.default_model
+                "model": self._base_api_params["model"]
             }
         ):
-            # Build API call parameters
-            api_params = {
-                "model": settings.default_model,
-                "max_tokens": settings.max_tokens,
-                "system": self.system_prompt,
-                "messages": messages
-            }
-
-            # Only add tools if they exist
-            if self.tools:
-                api_params["tools"] = self.tools
-
-            response = self.client.messages.create(**api_params)
-
-        tokens_in = response.usage.input_tokens
-        tokens_out = response.usage.output_tokens
-        tracer.record_tokens(tokens_in, tokens_out)
-
-        tracer.record_event(
-            TraceEventType.LLM_RESPONSE.value,
-            self.name,
-            {
-                "tokens_in": tokens_in,
-                "tokens_out": tokens_out,
-                "stop_reason": response.stop_reason
-            }
-        )
+            api_params = {**self._base_api_params, "messages": _with_cache_breakpoint(messages)}
+
+            sink = _text_sink.get()
+            streamed_text = False
+
+            with self.client.messages.stream(**api_params) as stream:
+                for event in stream:
+                    if event.type == "text":
+                        if sink is not None:
+                            streamed_text = True
+                            sink(event.text)
+                    elif (
+                        event.type == "content_block_stop"
+                        and started_tools is not None
+                        and event.content_block.type == "tool_use"
+                    ):
+                        block = event.content_block
+                        started_tools[block.id] = _tool_executor.submit(
+                            self._resolve_tool(block.name), block.input
+                        )
+                response = stream.get_final_message()
+
+            # Text preceding tool use is not the final answer
+            if streamed_text and response.stop_reason == "tool_use":
+                sink(None)
+
+        if cache_key is not None:
+            llm_cache.set(cache_key, response)
+
+        usage = response.usage
+        tokens_in = usage.input_tokens
+        tokens_out = usage.output_tokens
+        cache_creation = getattr(usage, "cache_creation_input_tokens", None) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+
+        if tracer.enabled:
+            tracer.record_tokens(tokens_in, tokens_out, cache_creation, cache_read)
+            tracer.record_event(
+                TraceEventType.LLM_RESPONSE.value,
+                self.name,
+                {
+                    "tokens_in": tokens_in,
+                    "tokens_out": tokens_out,
+                    "cache_creation_tokens": cache_creation,
+                    "cache_read_tokens": cache_read,
+                    "stop_reason": response.stop_reason
+                }
+            )
 
         self.logger.debug(
             "LLM call completed",
             tokens_in=tokens_in,
             tokens_out=tokens_out,
+            cache_creation_tokens=cache_creation,
+            cache_read_tokens=cache_read,
             stop_reason=response.stop_reason
         )
 
         return response, tokens_in, tokens_out
 
+    def _replay_cached_response(self, response: Any) -> tuple[Any, int, int]:
+        """Return a cached LLM response as if it had just been generated.
+
+        No tokens are billed for a cache hit, so token counts are reported as 0.
+
+        Args:
+            response: Previously stored Anthropic API response
+
+        Returns:
+            Tuple of (response, 0, 0)
+        """
+        sink = _text_sink.get()
+        if sink is not None and response.stop_reason != "tool_use":
+            text = self._extract_text_response(response)
+            if text:
+                sink(text)
+
+        if tracer.enabled:
+            tracer.record_event(
+                TraceEventType.LLM_RESPONSE.value,
+                self.name,
+                {"cache_hit": True, "stop_reason": response.stop_reason}
+            )
+
+        self.logger.debug("LLM cache hit", stop_reason=response.stop_reason)
+
+        return response, 0, 0
+
+    def _execute_tools(
+        self,
+        tool_calls: list[dict[str, Any]],
+        started_tools: dict[str, Future] | None = None
+    ) -> list[str]:
+        """Execute tool calls, concurrently when there is more than one.
+
+        Trace events are recorded on the calling thread; tools run on the
+        shared pool since they are I/O-bound (HTTP/DB lookups).
+
+        Args:
+            tool_calls: Tool call dictionaries from _extract_tool_calls
+            started_tools: Futures for calls already started by _call_llm
+
+        Returns:
+            Encoded tool results (TOON tables or JSON) in the same order as
+            tool_calls
+        """
+        started_tools = started_tools or {}
+        tracing = tracer.enabled
+
+        for tc in tool_calls:
+            if tracing:
+                tracer.record_event(
+                    TraceEventType.TOOL_CALL.value,
+                    self.name,
+                    {"tool": tc["name"], "input": tc["input"]}
+                )
+
+            self.logger.debug(f"Executing tool: {tc['name']}", tool=tc["name"])
+
+        if len(tool_calls) == 1 and tool_calls[0]["id"] not in started_tools:
+            results = [self._resolve_tool(tool_calls[0]["name"])(tool_calls[0]["input"])]
+        else:
+            futures = [
+                started_tools.get(tc["id"])
+                or _tool_executor.submit(self._resolve_tool(tc["name"]), tc["input"])
+                for tc in tool_calls
+            ]
+            results = [future.result() for future in futures]
+
+        encoded = []
+        for tc, result in zip(tool_calls, results):
+            if settings.token_budget_projection:
+                result = project_tool_result(tc["name"], result)
+            payload = encode_tool_result(result)
+            encoded.append(payload.decode())
+
+            if tracing:
+                tracer.record_event(
+                    TraceEventType.TOOL_RESULT.value,
+                    self.name,
+                    {"tool": tc["name"], "result_size": len(payload)}
+                )
+
+        return encoded
+
+    def _resolve_tool(self, name: str) -> Callable[[dict[str, Any]], Any]:
+        """Get the callable for a tool, resolving names outside the agent's tools.
+
+        Args:
+            name: Tool name from a tool_use block
+
+        Returns:
+            Callable taking the tool input
+        """
+        return self._tool_dispatch.get(name) or bind_tool(name)
+
     def _build_messages(
         self,
         user_message: str,
@@ -142,16 +519,18 @@ class BaseAgent(ABC):
         """
         messages = []
 
-        # Add conversation history if provided
+        # Add conversation history if provided, capped to bound prompt size
         if conversation_history:
-            messages.extend(conversation_history)
+            messages.extend(
+                _trim_history(conversation_history, self._history_limit)
+            )
 
         # Build current message with optional context
         content = user_message
         if context:
             context_str = self._format_context(context)
             if context_str:
-                content = f"{context_str}\n\nUser request: {user_message}"
+                content = "".join((context_str, "\n\nUser request: ", user_message))
 
         messages.append({"role": "user", "content": content})
         return messages
@@ -165,17 +544,39 @@ class BaseAgent(ABC):
         Returns:
             Formatted context string
         """
-        parts = []
+        parts: list[str] = []
 
         # Add user preferences if available
         if prefs := context.get("user_preferences"):
-            parts.append(f"User Preferences:\n{prefs}")
+            parts += ("User Preferences:\n", str(prefs))
 
         # Add intermediate results if available
         if results := context.get("intermediate_results"):
-            parts.append(f"Previous Results:\n{results}")
+            if parts:
+                parts.append("\n\n")
+            parts += ("Previous Results:\n", str(results))
+
+        return "".join(parts)
 
-        return "\n\n".join(parts)
+    def _partition_content(self, response: Any) -> tuple[str, list[dict[str, Any]]]:
+        """Split an API response into its text and tool calls in one pass.
+
+        Args:
+            response: Anthropic API response
+
+        Returns:
+            Tuple of (first text block or "", tool call dictionaries)
+        """
+        text = None
+        tool_calls = []
+        for block in response.content:
+            block_type = block.type
+            if block_type == "text":
+                if text is None:
+                    text = block.text
+            elif block_type == "tool_use":
+                tool_calls.append({"id": block.id, "name": block.name, "input": block.input})
+        return text or "", tool_calls
 
     def _extract_text_response(self, response: Any) -> str:
         """Extract text content from API response.
@@ -186,10 +587,7 @@ class BaseAgent(ABC):
         Returns:
             Extracted text content
         """
-        for block in response.content:
-            if block.type == "text":
-                return block.text
-        return ""
+        return self._partition_content(response)[0]
 
     def _extract_tool_calls(self, response: Any) -> list[dict[str, Any]]:
         """Extract tool calls from API response.
@@ -200,11 +598,7 @@ class BaseAgent(ABC):
         Returns:
             List of tool call dictionaries
         """
-        return [
-            {"id": block.id, "name": block.name, "input": block.input}
-            for block in response.content
-            if block.type == "tool_use"
-        ]
+        return self._partition_content(response)[1]
 
     def _has_tool_use(self, response: Any) -> bool:
         """Check if response contains tool use.
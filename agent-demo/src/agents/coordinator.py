@@ -76,7 +76,7 @@ class CoordinatorAgent(BaseAgent):
         tracer.record_event(
             TraceEventType.AGENT_START.value,
             self.name,
-            {"query": user_message[:100]}
+            {"query": user_message}
         )
 
         self.logger.info("Coordinator processing request", query_length=len(user_message))
@@ -1,5 +1,13 @@
 """System prompts for each agent. Centralized for easy tuning."""
 
+# Appended to prompts of agents that receive tool results
+TOOL_RESULT_FORMAT = """
+
+Tool result format:
+- Lists of records may come back as a compact table: a header `[N]{field1,field2,...}:` followed by N rows of comma-separated values in header order
+- Multi-valued fields separate their values with `|`; quoted values are JSON strings
+- Other results are plain JSON"""
+
 COORDINATOR_PROMPT = """You are the Coordinator Agent for an artist-venue matching system.
 
 Your role:
@@ -35,7 +43,7 @@ Guidelines:
 - Consider genre fit, location, and typical venue capacity
 - Highlight unique characteristics (years active, style, etc.)
 - If you find many results, prioritize the most relevant matches
-- Be conversational and helpful in your explanations"""
+- Be conversational and helpful in your explanations""" + TOOL_RESULT_FORMAT
 
 VENUE_MATCHING_PROMPT = """You are the Venue Matching Agent specializing in:
 - Searching venues by location, capacity, and genre
@@ -51,7 +59,7 @@ Guidelines:
 - Consider capacity fit, genre alignment, and venue type
 - Mention relevant details (ages, typical pay range, atmosphere)
 - If you find many results, prioritize the most relevant matches
-- Be specific about why each venue suits the user's needs"""
+- Be specific about why each venue suits the user's needs""" + TOOL_RESULT_FORMAT
 
 BOOKING_ADVISOR_PROMPT = """You are the Booking Advisor Agent specializing in:
 - Synthesizing artist and venue information
@@ -69,4 +77,4 @@ Guidelines:
 - Explain WHY pairings would work well
 - Provide specific, actionable next steps (contact info, what to mention)
 - Consider practical factors (pay ranges, venue policies, audience fit)
-- Be helpful, specific, and realistic in your recommendations"""
+- Be helpful, specific, and realistic in your recommendations""" + TOOL_RESULT_FORMAT
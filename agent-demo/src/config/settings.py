@@ -4,10 +4,16 @@ import os
 import yaml
 from pathlib import Path
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from src.governance.models import GovernanceConfig
 
+# Use the libyaml C parser when available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -19,6 +25,9 @@ class Settings(BaseSettings):
 
     # Memory
     conversation_history_limit: int = Field(50, alias="CONVERSATION_HISTORY_LIMIT")
+    max_conversations: int = Field(1000, alias="MAX_CONVERSATIONS")
+    max_user_preferences: int = Field(1000, alias="MAX_USER_PREFERENCES")
+    max_working_contexts: int = Field(256, alias="MAX_WORKING_CONTEXTS")
 
     # Observability
     enable_tracing: bool = Field(True, alias="ENABLE_TRACING")
@@ -26,17 +35,29 @@ class Settings(BaseSettings):
 
     # Agent settings
     max_agent_iterations: int = Field(10, alias="MAX_AGENT_ITERATIONS")
+    tool_concurrency_limit: int = Field(4, alias="TOOL_CONCURRENCY_LIMIT")
+    token_budget_projection: bool = Field(True, alias="TOKEN_BUDGET_PROJECTION")
+
+    # LLM response cache (exact-match; meant for dev/test replays)
+    enable_llm_cache: bool = Field(False, alias="ENABLE_LLM_CACHE")
+    llm_cache_max_entries: int = Field(256, alias="LLM_CACHE_MAX_ENTRIES")
 
     # Governance settings
     enable_governance: bool = Field(True, alias="ENABLE_GOVERNANCE")
     governance_config_file: str = Field("config/governance.yaml", alias="GOVERNANCE_CONFIG")
 
+    # Parsed governance config keyed by (path, mtime) of the YAML file
+    _gov_cache: tuple[str, float, GovernanceConfig] | None = PrivateAttr(default=None)
+
     class Config:
         env_file = ".env"
         case_sensitive = False
 
     def load_governance_config(self) -> GovernanceConfig:
-        """Load governance configuration from YAML file"""
+        """Load governance configuration from YAML file
+
+        The parsed config is reused until the file's mtime changes.
+        """
         if not self.enable_governance:
             return GovernanceConfig(enabled=False)
 
@@ -46,13 +67,20 @@ class Settings(BaseSettings):
             return GovernanceConfig()
 
         try:
+            mtime = config_path.stat().st_mtime
+            cached = self._gov_cache
+            if cached and cached[0] == str(config_path) and cached[1] == mtime:
+                return cached[2]
+
             with open(config_path) as f:
-                yaml_config = yaml.safe_load(f)
+                yaml_config = yaml.load(f, Loader=_YamlLoader)
 
             # Extract governance section
             gov_config = yaml_config.get("governance", {})
 
-            return GovernanceConfig(**gov_config)
+            config = GovernanceConfig(**gov_config)
+            self._gov_cache = (str(config_path), mtime, config)
+            return config
         except Exception as e:
             print(f"Error loading governance config: {e}")
             return GovernanceConfig()
@@ -3,7 +3,7 @@ Agentic AI Governance Layer
 
 Provides production-ready safety & governance for multi-agent systems using:
 - NVIDIA NeMo Guardrails: Comprehensive agentic AI safety
-- pyrate-limiter: Cost control & rate limiting
+- Token-bucket cost control & rate limiting
 
 Note: GovernanceCoordinator is imported lazily to avoid pulling in heavy
 optional dependencies (Presidio, NeMo) at package load time.
@@ -1,22 +1,86 @@
 """
 Governance Coordinator
 
-Orchestrates all governance components (NeMo, Presidio, pyrate-limiter) into a unified layer.
+Orchestrates all governance components (NeMo, Presidio, cost control) into a unified layer.
 """
 
 import logging
+import os
+import re
 import time
 import uuid
-from typing import Optional, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple
 
-from .models import GovernanceConfig, GuardrailResult, PIIProtectionResult, BudgetCheckResult
+from .models import GovernanceConfig, GuardrailResult, PIIProtectionResult
 from .nemo_wrapper import NeMoGuardrailsWrapper
 from .pii_protection import PIIProtector
 from .cost_control import CostController
-from .audit import AuditLogger
+from .audit import AuditLogger, AUDIT_TEXT_LIMIT
+from src.observability.logger import route_to_queue
 
 logger = logging.getLogger(__name__)
 
+# Governance module loggers (coordinator, audit, cost control, NeMo) write
+# through the shared background log listener rather than blocking on stderr.
+# Done here rather than in the package __init__, which settings imports
+# (via models) before the logger module can load
+route_to_queue(__package__)
+
+# Inputs that are nothing but short acknowledgements ("ok", "yes, thanks!")
+# contain no PII, so Presidio is skipped for them
+_TRIVIAL_INPUT_MAX_LEN = 64
+_TRIVIAL_INPUT = re.compile(
+    r"\s*(?:(?:yes|yeah|yep|no|nope|ok|okay|sure|thanks|thank you|cool|great|sounds good)\W*)*",
+    re.IGNORECASE
+)
+
+# Joins input and output for a single PII pass; contains no PII-like tokens
+# and keeps entities from spanning both sides
+_PII_SEPARATOR = "\n\u0001\n"
+
+# Event IDs are drawn from a pool filled from one os.urandom() call
+_EVENT_ID_BATCH = 1024
+_event_ids: deque = deque()
+
+
+def _next_event_id() -> str:
+    """Return a random (version 4) UUID hex string for a governance event"""
+    try:
+        return _event_ids.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _EVENT_ID_BATCH)
+        _event_ids.extend(
+            uuid.UUID(bytes=raw[i:i + 16], version=4).hex
+            for i in range(16, len(raw), 16)
+        )
+        return uuid.UUID(bytes=raw[:16], version=4).hex
+
+
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for governance methods that do nothing when disabled"""
+
+
+def _passthrough_input(user_input: str, *args, **kwargs) -> Dict[str, Any]:
+    """check_input when governance is disabled: pass the input through"""
+    return {"passed": True, "sanitized_input": user_input, "violations": [], "event_id": ""}
+
+
+def _passthrough_output(agent_output: str, *args, **kwargs) -> Dict[str, Any]:
+    """check_output when governance is disabled: pass the output through"""
+    return {"passed": True, "sanitized_output": agent_output, "violations": []}
+
+
+def _passthrough_roundtrip(user_input: str, agent_output: str, *args, **kwargs) -> Dict[str, Any]:
+    """check_roundtrip when governance is disabled: pass both sides through"""
+    return {
+        "passed": True,
+        "sanitized_input": user_input,
+        "sanitized_output": agent_output,
+        "violations": []
+    }
+
 
 class GovernanceCoordinator:
     """
@@ -25,7 +89,7 @@ class GovernanceCoordinator:
     Orchestrates:
     - NeMo Guardrails (jailbreak, content safety, topic control)
     - Presidio (PII protection)
-    - pyrate-limiter (cost control, rate limiting)
+    - CostController (cost control, rate limiting)
     - Audit logging
     """
 
@@ -41,6 +105,11 @@ class GovernanceCoordinator:
 
         if not self.enabled:
             logger.warning("Governance layer is DISABLED - no safety checks will be applied!")
+            # Bind pass-through versions so disabled calls skip all checks
+            self.check_input = _passthrough_input
+            self.check_output = _passthrough_output
+            self.check_roundtrip = _passthrough_roundtrip
+            self.commit_usage = self.log_response = _noop
             return
 
         # Initialize components
@@ -59,7 +128,7 @@ class GovernanceCoordinator:
             allowed_entities=config.pii_allowed_entities
         )
 
-        # 3. Cost Controller (pyrate-limiter)
+        # 3. Cost Controller (token buckets)
         self.cost_controller = CostController(
             enabled=config.budgets_enabled,
             enforce=config.budgets_enforce,
@@ -70,6 +139,10 @@ class GovernanceCoordinator:
             tokens_per_hour=config.tokens_per_hour
         )
 
+        # PII protection runs here concurrently with the NeMo check; both
+        # spend their time outside the GIL (LLM call, native NLP code)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="governance")
+
         # 4. Audit Logger
         self.audit_logger = AuditLogger(
             enabled=config.audit_enabled,
@@ -107,15 +180,7 @@ class GovernanceCoordinator:
                 - violations: list
                 - event_id: str
         """
-        if not self.enabled:
-            return {
-                "passed": True,
-                "sanitized_input": user_input,
-                "violations": [],
-                "event_id": str(uuid.uuid4())
-            }
-
-        event_id = str(uuid.uuid4())
+        event_id = _next_event_id()
         start_time = time.time()
         violations = []
 
@@ -123,7 +188,7 @@ class GovernanceCoordinator:
         self.audit_logger.log_request(
             event_id=event_id,
             session_id=session_id,
-            user_input=user_input,
+            user_input=user_input[:AUDIT_TEXT_LIMIT],
             user_id=user_id
         )
 
@@ -159,8 +224,21 @@ class GovernanceCoordinator:
             user_id=user_id
         )
 
+        trivial = len(user_input) <= _TRIVIAL_INPUT_MAX_LEN and _TRIVIAL_INPUT.fullmatch(user_input)
+
+        # Steps 2 and 3 only read the input, so PII protection starts on the
+        # pool while NeMo runs here
+        pii_future = None
+        if not trivial:
+            pii_future = self._executor.submit(
+                self.pii_protector.protect_text, user_input, context="user_input"
+            )
+
         # Step 2: NeMo Guardrails check
-        guardrail_result = self.nemo.check_input(user_input)
+        if trivial and self.config.nemo_skip_trivial_inputs:
+            guardrail_result = GuardrailResult(passed=True, metadata={"skipped": "trivial_input"})
+        else:
+            guardrail_result = self.nemo.check_input(user_input)
 
         if not guardrail_result.passed:
             violations.extend(guardrail_result.violations)
@@ -175,8 +253,10 @@ class GovernanceCoordinator:
                 user_id=user_id
             )
 
-            # Release reservation
+            # Release reservation; the PII result is no longer needed
             self.cost_controller.release_reservation(reservation_id, session_id, user_id)
+            if pii_future is not None:
+                pii_future.cancel()
 
             return {
                 "passed": False,
@@ -187,7 +267,15 @@ class GovernanceCoordinator:
             }
 
         # Step 3: PII detection & protection
-        pii_result = self.pii_protector.protect_text(user_input, context="user_input")
+        if pii_future is None:
+            pii_result = PIIProtectionResult(
+                has_pii=False,
+                protected_text=user_input,
+                entities=[],
+                audit_id=event_id
+            )
+        else:
+            pii_result = pii_future.result()
 
         if pii_result.has_pii:
             pii_types = [e.entity_type for e in pii_result.entities]
@@ -242,13 +330,6 @@ class GovernanceCoordinator:
         Returns:
             Dict with passed status and sanitized output
         """
-        if not self.enabled:
-            return {
-                "passed": True,
-                "sanitized_output": agent_output,
-                "violations": []
-            }
-
         violations = []
 
         # Step 1: NeMo output check
@@ -281,6 +362,125 @@ class GovernanceCoordinator:
             "pii_result": pii_result
         }
 
+    def check_roundtrip(
+        self,
+        user_input: str,
+        agent_output: str,
+        session_id: str,
+        event_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate a completed exchange with a single PII pass
+
+        For callers that already hold both sides (batch pipelines, re-audits).
+        Runs the NeMo input and output checks and one Presidio analysis over
+        input and output together. Budgets are not checked or reserved.
+
+        Args:
+            user_input: User's input message
+            agent_output: Agent's response
+            session_id: Session identifier
+            event_id: Optional event ID to link to; generated if omitted
+            user_id: Optional user identifier
+
+        Returns:
+            Dict with passed status, sanitized input/output and violations
+        """
+        event_id = event_id or _next_event_id()
+        violations = []
+
+        # The fused PII pass runs on the pool while NeMo runs here
+        pii_future = self._executor.submit(self._protect_pair, user_input, agent_output)
+        input_guardrails = self.nemo.check_input(user_input)
+        output_guardrails = self.nemo.check_output(agent_output)
+        for violation_type, result in (
+            ("guardrails_failed", input_guardrails),
+            ("output_guardrails_failed", output_guardrails)
+        ):
+            if not result.passed:
+                violations.extend(result.violations)
+                self.audit_logger.log_violation(
+                    event_id=event_id,
+                    session_id=session_id,
+                    violation_type=violation_type,
+                    details={"violations": result.violations},
+                    user_id=user_id
+                )
+
+        input_pii, output_pii = pii_future.result()
+
+        if input_pii.has_pii:
+            self.audit_logger.log_pii_event(
+                event_id=event_id,
+                session_id=session_id,
+                pii_count=len(input_pii.entities),
+                pii_types=[e.entity_type for e in input_pii.entities],
+                audit_id=input_pii.audit_id,
+                user_id=user_id
+            )
+        if output_pii.has_pii:
+            logger.warning(f"PII detected in agent output: {len(output_pii.entities)} entities")
+
+        return {
+            "passed": len(violations) == 0,
+            "sanitized_input": input_pii.protected_text,
+            "sanitized_output": output_pii.protected_text,
+            "violations": violations,
+            "event_id": event_id,
+            "guardrail_results": (input_guardrails, output_guardrails),
+            "pii_results": (input_pii, output_pii)
+        }
+
+    def _protect_pair(
+        self,
+        user_input: str,
+        agent_output: str
+    ) -> Tuple[PIIProtectionResult, PIIProtectionResult]:
+        """
+        Run PII protection over input and output in one analyzer pass
+
+        Entities are split back out by offset. Falls back to two separate
+        passes if the anonymized text no longer splits cleanly.
+
+        Returns:
+            Tuple of (input result, output result)
+        """
+        combined = self.pii_protector.protect_text(
+            _PII_SEPARATOR.join((user_input, agent_output)),
+            context="user_input"
+        )
+
+        parts = combined.protected_text.split(_PII_SEPARATOR)
+        if len(parts) != 2:
+            return (
+                self.pii_protector.protect_text(user_input, context="user_input"),
+                self.pii_protector.protect_text(agent_output, context="agent_output")
+            )
+
+        offset = len(user_input) + len(_PII_SEPARATOR)
+        input_entities = [e for e in combined.entities if e.start < offset]
+        output_entities = [
+            e.model_copy(update={"start": e.start - offset, "end": e.end - offset})
+            for e in combined.entities
+            if e.start >= offset
+        ]
+
+        return (
+            PIIProtectionResult(
+                has_pii=bool(input_entities),
+                protected_text=parts[0],
+                entities=input_entities,
+                audit_id=combined.audit_id
+            ),
+            PIIProtectionResult(
+                has_pii=bool(output_entities),
+                protected_text=parts[1],
+                entities=output_entities,
+                audit_id=combined.audit_id
+            )
+        )
+
     def commit_usage(
         self,
         reservation_id: str,
@@ -299,14 +499,13 @@ class GovernanceCoordinator:
             user_id: Optional user ID
             agent_name: Optional agent name
         """
-        if self.enabled:
-            self.cost_controller.commit_usage(
-                reservation_id=reservation_id,
-                actual_tokens=actual_tokens,
-                session_id=session_id,
-                user_id=user_id,
-                agent_name=agent_name
-            )
+        self.cost_controller.commit_usage(
+            reservation_id=reservation_id,
+            actual_tokens=actual_tokens,
+            session_id=session_id,
+            user_id=user_id,
+            agent_name=agent_name
+        )
 
     def log_response(
         self,
@@ -328,15 +527,14 @@ class GovernanceCoordinator:
             latency_ms: Processing latency
             success: Whether request succeeded
         """
-        if self.enabled:
-            self.audit_logger.log_response(
-                event_id=event_id,
-                session_id=session_id,
-                response=response,
-                tokens_used=tokens_used,
-                latency_ms=latency_ms,
-                success=success
-            )
+        self.audit_logger.log_response(
+            event_id=event_id,
+            session_id=session_id,
+            response=response[:AUDIT_TEXT_LIMIT],
+            tokens_used=tokens_used,
+            latency_ms=latency_ms,
+            success=success
+        )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics from all governance components"""
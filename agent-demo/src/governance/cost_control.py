@@ -1,32 +1,100 @@
 """
-Cost Control & Rate Limiting using pyrate-limiter
+Cost Control & Rate Limiting
 
 Enforces budget limits and rate limits to prevent cost overruns and abuse.
 """
 
+import itertools
 import logging
+import threading
 import time
+from array import array
 from datetime import datetime, timedelta
-from typing import Dict, Optional
-from collections import defaultdict
-
-from pyrate_limiter import (
-    Duration,
-    Rate,
-    Limiter,
-    InMemoryBucket,
-    BucketFullException
-)
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 
 from .models import BudgetCheckResult
 
 logger = logging.getLogger(__name__)
 
+# Independently locked shards per usage counter (sessions, users)
+_USAGE_SHARDS = 16
+
+# Most sessions/users tracked per counter (and sessions with a request-rate
+# bucket); the least recently updated are evicted beyond this
+_MAX_TRACKED_KEYS = 10_000
+
+# Max finished TokenReservation objects kept for reuse
+_RESERVATION_POOL_SIZE = 1024
+
+# Shared result for every check while cost controls are disabled; safe to hand
+# out because BudgetCheckResult is frozen with a read-only remaining_tokens
+_DISABLED_OK = BudgetCheckResult(allowed=True)
+
+
+def _refill(bucket: Tuple[float, float], capacity: float, rate: float, now: float) -> float:
+    """Tokens in a (tokens, last_refill) bucket after refilling up to now"""
+    tokens, last_refill = bucket
+    return min(capacity, tokens + (now - last_refill) * rate)
+
+
+def _reset_datetime(deadline: Optional[float]) -> Optional[datetime]:
+    """Wall-clock time of a monotonic deadline (None stays None)"""
+    if deadline is None:
+        return None
+    return datetime.now() + timedelta(seconds=max(0.0, deadline - time.monotonic()))
+
+
+class _ShardedCounter:
+    """Integer counters keyed by string, split across independently locked shards
+
+    Concurrent sessions mostly land on different shards, so updates to one
+    session's usage do not wait on another's. Reads never create entries, and
+    each shard evicts its least recently updated key once it holds more than
+    its share of max_keys.
+    """
+
+    __slots__ = ("_shards", "_shard_cap")
+
+    def __init__(self, shards: int = _USAGE_SHARDS, max_keys: int = _MAX_TRACKED_KEYS):
+        self._shards = [(threading.Lock(), OrderedDict()) for _ in range(shards)]
+        self._shard_cap = -(-max_keys // shards)
+
+    def _shard(self, key: str) -> Tuple[threading.Lock, "OrderedDict[str, int]"]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def add(self, key: str, amount: int):
+        """Add amount to the counter for key, never going below 0
+
+        A key evicted while it held a reservation is recreated by the later
+        commit or release; clamping stops that negative delta from turning
+        into extra budget.
+        """
+        lock, counts = self._shard(key)
+        with lock:
+            counts[key] = max(0, counts.get(key, 0) + amount)
+            counts.move_to_end(key)
+            if len(counts) > self._shard_cap:
+                counts.popitem(last=False)
+
+    def get(self, key: str) -> int:
+        """Current count for key (0 if never counted)"""
+        return self._shard(key)[1].get(key, 0)
+
+    def __len__(self) -> int:
+        return sum(len(counts) for _, counts in self._shards)
+
 
 class TokenReservation:
     """Represents a reserved token allocation"""
 
+    __slots__ = ("reservation_id", "amount", "timestamp", "committed")
+
     def __init__(self, reservation_id: str, amount: int, timestamp: float):
+        self.reset(reservation_id, amount, timestamp)
+
+    def reset(self, reservation_id: str, amount: int, timestamp: float):
+        """(Re)initialize the reservation, e.g. when taken from the pool"""
         self.reservation_id = reservation_id
         self.amount = amount
         self.timestamp = timestamp
@@ -35,7 +103,7 @@ class TokenReservation:
 
 class CostController:
     """
-    Budget enforcement and rate limiting using pyrate-limiter
+    Budget enforcement and rate limiting with in-process token buckets
 
     Provides hierarchical budget controls:
     - Global daily limit
@@ -78,46 +146,46 @@ class CostController:
         self.requests_per_minute = requests_per_minute
         self.tokens_per_hour = tokens_per_hour
 
-        # Initialize limiters
-        if self.enabled:
-            self._initialize_limiters()
-
-        # Track token usage
+        # Token buckets stored as (tokens, last_refill) pairs, last_refill in
+        # monotonic seconds: one per session for requests/minute and one
+        # global bucket for tokens/hour. Buckets start full and are refilled
+        # lazily from the elapsed time when checked, so no background refill
+        # task or timer is needed
+        self._request_refill_rate = requests_per_minute / 60.0
+        self._token_refill_rate = tokens_per_hour / 3600.0
+        self._request_buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._token_bucket: Tuple[float, float] = (float(tokens_per_hour), time.monotonic())
+        self._bucket_lock = threading.Lock()
+
+        # Track token usage; global_usage and _remaining_global (daily limit
+        # minus usage, may go negative) only change together under _global_lock
         self.global_usage = 0
-        self.session_usage: Dict[str, int] = defaultdict(int)
-        self.user_usage: Dict[str, int] = defaultdict(int)
-        self.agent_usage: Dict[str, int] = defaultdict(int)
-
-        # Track reservations
+        self._remaining_global = global_daily_tokens
+        self._global_lock = threading.Lock()
+        self.session_usage = _ShardedCounter()
+        self.user_usage = _ShardedCounter()
+        # Agents are few and fixed: each gets a slot in an int64 array on first
+        # use, so commits bump an array element instead of a dict entry
+        self._agent_idx: Dict[str, int] = {}
+        self._agent_counts = array("q")
+
+        # Track reservations. IDs are only keys into this dict, so a counter
+        # is enough; next() on itertools.count is atomic under the GIL
         self.reservations: Dict[str, TokenReservation] = {}
+        self._reservation_ids = itertools.count(1)
+
+        # Finished reservations are recycled; list pop/append are atomic
+        self._reservation_pool: List[TokenReservation] = []
 
         # Track reset times
-        self.global_reset_time = datetime.now() + timedelta(days=1)
-        self.session_reset_times: Dict[str, datetime] = {}
-        self.user_reset_times: Dict[str, datetime] = {}
+        # Reset deadlines are monotonic seconds; datetimes are only built for
+        # the reset_time of a denied result
+        self._global_reset_at = time.monotonic() + 86400.0
+        self.session_reset_times: Dict[str, float] = {}
+        self.user_reset_times: Dict[str, float] = {}
 
         logger.info(f"Cost controller initialized (enabled={enabled}, enforce={enforce})")
 
-    def _initialize_limiters(self):
-        """Initialize pyrate-limiter rate limiters"""
-        try:
-            # Global rate limiter: tokens per hour
-            self.global_rate_limiter = Limiter(
-                Rate(self.tokens_per_hour, Duration.HOUR),
-                bucket_class=InMemoryBucket
-            )
-
-            # Request rate limiter: requests per minute
-            self.request_rate_limiter = Limiter(
-                Rate(self.requests_per_minute, Duration.MINUTE),
-                bucket_class=InMemoryBucket
-            )
-
-            logger.info("Pyrate-limiter initialized")
-        except Exception as e:
-            logger.error(f"Failed to initialize rate limiters: {e}")
-            self.enabled = False
-
     def check_budget(
         self,
         estimated_tokens: int,
@@ -138,27 +206,125 @@ class CostController:
             BudgetCheckResult indicating if request is allowed
         """
         if not self.enabled:
-            return BudgetCheckResult(
-                allowed=True,
-                remaining_tokens={},
-                reason=None
-            )
+            return _DISABLED_OK
+
+        with self._bucket_lock:
+            return self._check_locked(estimated_tokens, session_id, user_id, time.monotonic())
+
+    def check_budget_batch(
+        self,
+        requests: List[Tuple[int, str, Optional[str], Optional[str]]]
+    ) -> List[BudgetCheckResult]:
+        """
+        Check several requests at once, e.g. the calls an agent loop is about to make
+
+        Equivalent to calling check_budget for each request in order, but the
+        rate-limit lock is taken and the clock read once for the whole batch.
 
+        Args:
+            requests: (estimated_tokens, session_id, user_id, agent_name) tuples
+
+        Returns:
+            One BudgetCheckResult per request, in the same order
+        """
+        if not self.enabled:
+            return [_DISABLED_OK] * len(requests)
+
+        results: List[BudgetCheckResult] = [None] * len(requests)
+        now = time.monotonic()
+        with self._bucket_lock:
+            for i, (estimated_tokens, session_id, user_id, _agent_name) in enumerate(requests):
+                results[i] = self._check_locked(estimated_tokens, session_id, user_id, now)
+        return results
+
+    def _check_locked(
+        self,
+        estimated_tokens: int,
+        session_id: str,
+        user_id: Optional[str],
+        now: float
+    ) -> BudgetCheckResult:
+        """Budget and rate-limit checks for one request (caller holds _bucket_lock)"""
+        # One comparison against the tightest of the global, session and user
+        # headroom; the per-level checks only run when some limit is exceeded
+        session_usage = self.session_usage.get(session_id)
+        user_usage = self.user_usage.get(user_id) if user_id else 0
+        headroom = min(self._remaining_global, self.per_session_tokens - session_usage)
+        if user_id:
+            headroom = min(headroom, self.per_user_daily_tokens - user_usage)
+
+        if estimated_tokens > headroom:
+            denied = self._budget_denial(estimated_tokens, session_usage, user_id, user_usage)
+            if denied:
+                return denied
+
+        # Check rate limits: both buckets must have room before either is drawn
+        requests = _refill(
+            self._request_buckets.get(session_id, (self.requests_per_minute, now)),
+            self.requests_per_minute, self._request_refill_rate, now
+        )
+        tokens = _refill(self._token_bucket, self.tokens_per_hour, self._token_refill_rate, now)
+        if requests >= 1 and tokens >= estimated_tokens:
+            self._request_buckets[session_id] = (requests - 1, now)
+            self._request_buckets.move_to_end(session_id)
+            if len(self._request_buckets) > _MAX_TRACKED_KEYS:
+                # An evicted session just starts again with a full bucket
+                self._request_buckets.popitem(last=False)
+            self._token_bucket = (tokens - estimated_tokens, now)
+            rate_limited = None
+        elif requests < 1:
+            rate_limited = f"{self.requests_per_minute} requests per minute"
+        else:
+            rate_limited = f"{self.tokens_per_hour} tokens per hour"
+
+        if rate_limited:
+            reason = f"Rate limit exceeded: {rate_limited}"
+            logger.warning(reason)
+
+            if self.enforce:
+                return BudgetCheckResult(
+                    allowed=False,
+                    remaining_tokens={},
+                    reason=reason
+                )
+
+        # All checks passed
+        return BudgetCheckResult(
+            allowed=True,
+            remaining_tokens={
+                "global": max(0, self._remaining_global),
+                "session": max(0, self.per_session_tokens - session_usage),
+                "user": max(0, self.per_user_daily_tokens - user_usage)
+            },
+            reason=None
+        )
+
+    def _budget_denial(
+        self,
+        estimated_tokens: int,
+        session_usage: int,
+        user_id: Optional[str],
+        user_usage: int
+    ) -> Optional[BudgetCheckResult]:
+        """Find which budget level a request exceeds, logging each one
+
+        Returns:
+            The denial for the first exceeded level when enforcing, else None
+        """
         # Check global daily limit
-        if self.global_usage + estimated_tokens > self.global_daily_tokens:
+        if estimated_tokens > self._remaining_global:
             reason = f"Global daily limit exceeded ({self.global_usage}/{self.global_daily_tokens})"
             logger.warning(reason)
 
             if self.enforce:
                 return BudgetCheckResult(
                     allowed=False,
-                    remaining_tokens={"global": max(0, self.global_daily_tokens - self.global_usage)},
+                    remaining_tokens={"global": max(0, self._remaining_global)},
                     reason=reason,
-                    reset_time=self.global_reset_time
+                    reset_time=_reset_datetime(self._global_reset_at)
                 )
 
         # Check session limit
-        session_usage = self.session_usage[session_id]
         if session_usage + estimated_tokens > self.per_session_tokens:
             reason = f"Session limit exceeded ({session_usage}/{self.per_session_tokens})"
             logger.warning(reason)
@@ -171,49 +337,19 @@ class CostController:
                 )
 
         # Check user daily limit (if user_id provided)
-        if user_id:
-            user_usage = self.user_usage[user_id]
-            if user_usage + estimated_tokens > self.per_user_daily_tokens:
-                reason = f"User daily limit exceeded ({user_usage}/{self.per_user_daily_tokens})"
-                logger.warning(reason)
-
-                if self.enforce:
-                    return BudgetCheckResult(
-                        allowed=False,
-                        remaining_tokens={"user": max(0, self.per_user_daily_tokens - user_usage)},
-                        reason=reason,
-                        reset_time=self.user_reset_times.get(user_id)
-                    )
-
-        # Check rate limits using pyrate-limiter
-        try:
-            # Check request rate limit
-            self.request_rate_limiter.try_acquire(session_id, weight=1)
-
-            # Check token rate limit
-            self.global_rate_limiter.try_acquire("global", weight=estimated_tokens)
-
-        except BucketFullException as e:
-            reason = f"Rate limit exceeded: {e}"
+        if user_id and user_usage + estimated_tokens > self.per_user_daily_tokens:
+            reason = f"User daily limit exceeded ({user_usage}/{self.per_user_daily_tokens})"
             logger.warning(reason)
 
             if self.enforce:
                 return BudgetCheckResult(
                     allowed=False,
-                    remaining_tokens={},
-                    reason=reason
+                    remaining_tokens={"user": max(0, self.per_user_daily_tokens - user_usage)},
+                    reason=reason,
+                    reset_time=_reset_datetime(self.user_reset_times.get(user_id))
                 )
 
-        # All checks passed
-        return BudgetCheckResult(
-            allowed=True,
-            remaining_tokens={
-                "global": max(0, self.global_daily_tokens - self.global_usage),
-                "session": max(0, self.per_session_tokens - session_usage),
-                "user": max(0, self.per_user_daily_tokens - self.user_usage.get(user_id or "", 0))
-            },
-            reason=None
-        )
+        return None
 
     def reserve_tokens(
         self,
@@ -232,24 +368,26 @@ class CostController:
         Returns:
             Reservation ID
         """
-        import uuid
-        reservation_id = str(uuid.uuid4())
+        reservation_id = format(next(self._reservation_ids), "x")
 
-        reservation = TokenReservation(
-            reservation_id=reservation_id,
-            amount=amount,
-            timestamp=time.time()
-        )
+        try:
+            reservation = self._reservation_pool.pop()
+            reservation.reset(reservation_id, amount, time.time())
+        except IndexError:
+            reservation = TokenReservation(
+                reservation_id=reservation_id,
+                amount=amount,
+                timestamp=time.time()
+            )
 
         self.reservations[reservation_id] = reservation
 
         # Update usage (will be adjusted when committed)
-        self.global_usage += amount
-        self.session_usage[session_id] += amount
-        if user_id:
-            self.user_usage[user_id] += amount
+        self._add_usage(amount, session_id, user_id)
 
-        logger.debug(f"Reserved {amount} tokens (reservation_id={reservation_id})")
+        # Lazy %-args: debug lines on the reserve/commit/release path are
+        # formatted only when debug logging is actually enabled
+        logger.debug("Reserved %d tokens (reservation_id=%s)", amount, reservation_id)
 
         return reservation_id
 
@@ -271,45 +409,74 @@ class CostController:
             user_id: Optional user ID
             agent_name: Optional agent name
         """
-        reservation = self.reservations.get(reservation_id)
+        reservation = self.reservations.pop(reservation_id, None)
         if not reservation:
             logger.warning(f"Reservation {reservation_id} not found")
             # Still track usage
-            self.global_usage += actual_tokens
-            self.session_usage[session_id] += actual_tokens
-            if user_id:
-                self.user_usage[user_id] += actual_tokens
+            self._add_usage(actual_tokens, session_id, user_id)
             if agent_name:
-                self.agent_usage[agent_name] += actual_tokens
+                self._agent_counts[self._agent_id(agent_name)] += actual_tokens
             return
 
         # Adjust usage (remove reservation, add actual)
         reserved_amount = reservation.amount
         difference = actual_tokens - reserved_amount
 
-        self.global_usage += difference
-        self.session_usage[session_id] += difference
-        if user_id:
-            self.user_usage[user_id] += difference
+        self._add_usage(difference, session_id, user_id)
         if agent_name:
-            self.agent_usage[agent_name] += actual_tokens
+            self._agent_counts[self._agent_id(agent_name)] += actual_tokens
 
-        # Mark as committed
+        # Committed reservations are done with; a later release is a no-op
         reservation.committed = True
+        self._recycle(reservation)
 
-        logger.debug(f"Committed {actual_tokens} tokens (reserved={reserved_amount}, diff={difference})")
+        logger.debug("Committed %d tokens (reserved=%d, diff=%d)", actual_tokens, reserved_amount, difference)
 
     def release_reservation(self, reservation_id: str, session_id: str, user_id: Optional[str] = None):
         """Release unused reservation"""
         reservation = self.reservations.pop(reservation_id, None)
         if reservation and not reservation.committed:
             # Release the reserved tokens
-            self.global_usage -= reservation.amount
-            self.session_usage[session_id] -= reservation.amount
-            if user_id:
-                self.user_usage[user_id] -= reservation.amount
-
-            logger.debug(f"Released reservation {reservation_id} ({reservation.amount} tokens)")
+            self._add_usage(-reservation.amount, session_id, user_id)
+
+            logger.debug("Released reservation %s (%d tokens)", reservation_id, reservation.amount)
+            self._recycle(reservation)
+
+    def _recycle(self, reservation: TokenReservation):
+        """Return a finished reservation to the pool (bounded)"""
+        if len(self._reservation_pool) < _RESERVATION_POOL_SIZE:
+            self._reservation_pool.append(reservation)
+
+    def _add_usage(self, amount: int, session_id: str, user_id: Optional[str] = None):
+        """Apply a usage delta to the global, session and user counters"""
+        with self._global_lock:
+            self.global_usage += amount
+            self._remaining_global -= amount
+        self.session_usage.add(session_id, amount)
+        if user_id:
+            self.user_usage.add(user_id, amount)
+
+    def _agent_id(self, agent_name: str) -> int:
+        """Index of agent_name's usage counter, assigned on first use"""
+        idx = self._agent_idx.get(agent_name)
+        if idx is None:
+            with self._global_lock:
+                idx = self._agent_idx.get(agent_name)
+                if idx is None:
+                    idx = len(self._agent_counts)
+                    self._agent_counts.append(0)
+                    self._agent_idx[agent_name] = idx
+        return idx
+
+    @property
+    def agent_usage(self) -> Dict[str, int]:
+        """Tokens committed per agent"""
+        return dict(zip(self._agent_idx, self._agent_counts))
+
+    @property
+    def global_reset_time(self) -> datetime:
+        """When the global daily budget resets"""
+        return _reset_datetime(self._global_reset_at)
 
     def get_stats(self) -> Dict[str, any]:
         """Get cost controller statistics"""
@@ -320,6 +487,6 @@ class CostController:
             "global_limit": self.global_daily_tokens,
             "session_count": len(self.session_usage),
             "user_count": len(self.user_usage),
-            "agent_usage": dict(self.agent_usage),
-            "active_reservations": len([r for r in self.reservations.values() if not r.committed])
+            "agent_usage": self.agent_usage,
+            "active_reservations": len(self.reservations)
         }
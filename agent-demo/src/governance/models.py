@@ -2,19 +2,46 @@
 Data models for governance layer
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class GuardrailResult(BaseModel):
+# Per-request check results are plain slotted dataclasses: they are built on
+# every governance check and never validated or serialized, so pydantic's
+# validation would be pure overhead on the hot path. They are frozen, with
+# tuple and read-only mapping fields, so shared instances (disabled-mode
+# singletons, cached verdicts) cannot be changed by one caller under another
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(result: Any, sequences: Tuple[str, ...], mappings: Tuple[str, ...]) -> None:
+    """Replace mutable containers passed to a frozen result with read-only ones."""
+    for name in sequences:
+        value = getattr(result, name)
+        if not isinstance(value, tuple):
+            object.__setattr__(result, name, tuple(value))
+    for name in mappings:
+        value = getattr(result, name)
+        if not isinstance(value, MappingProxyType):
+            object.__setattr__(result, name, MappingProxyType(dict(value)))
+
+
+@dataclass(slots=True, frozen=True)
+class GuardrailResult:
     """Result from NeMo Guardrails check"""
 
-    passed: bool = Field(..., description="Whether input/output passed guardrails")
-    filtered_content: Optional[str] = Field(None, description="Filtered/sanitized content")
-    violations: List[str] = Field(default_factory=list, description="List of violations detected")
-    risk_score: float = Field(0.0, ge=0.0, le=1.0, description="Risk score (0-1)")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    passed: bool  # Whether input/output passed guardrails
+    filtered_content: Optional[str] = None  # Filtered/sanitized content
+    violations: Tuple[str, ...] = ()  # Violations detected
+    risk_score: float = 0.0  # Risk score (0-1)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_MAPPING)  # Additional metadata
+
+    def __post_init__(self) -> None:
+        _freeze(self, ("violations",), ("metadata",))
 
 
 class PIIEntity(BaseModel):
@@ -27,22 +54,30 @@ class PIIEntity(BaseModel):
     text: str = Field(..., description="Original text")
 
 
-class PIIProtectionResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PIIProtectionResult:
     """Result from PII protection"""
 
-    has_pii: bool = Field(..., description="Whether PII was detected")
-    protected_text: str = Field(..., description="Text with PII anonymized")
-    entities: List[PIIEntity] = Field(default_factory=list, description="Detected PII entities")
-    audit_id: str = Field(..., description="Audit ID for tracking")
+    has_pii: bool  # Whether PII was detected
+    protected_text: str  # Text with PII anonymized
+    audit_id: str  # Audit ID for tracking
+    entities: Tuple[PIIEntity, ...] = ()  # Detected PII entities
+
+    def __post_init__(self) -> None:
+        _freeze(self, ("entities",), ())
 
 
-class BudgetCheckResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BudgetCheckResult:
     """Result from budget check"""
 
-    allowed: bool = Field(..., description="Whether request is within budget")
-    remaining_tokens: Dict[str, int] = Field(default_factory=dict, description="Remaining tokens by level")
-    reason: Optional[str] = Field(None, description="Reason if denied")
-    reset_time: Optional[datetime] = Field(None, description="When budget resets")
+    allowed: bool  # Whether request is within budget
+    remaining_tokens: Mapping[str, int] = field(default_factory=lambda: _EMPTY_MAPPING)  # Remaining tokens by level
+    reason: Optional[str] = None  # Reason if denied
+    reset_time: Optional[datetime] = None  # When budget resets
+
+    def __post_init__(self) -> None:
+        _freeze(self, (), ("remaining_tokens",))
 
 
 class AuditEvent(BaseModel):
@@ -75,11 +110,17 @@ class AuditEvent(BaseModel):
 class GovernanceConfig(BaseModel):
     """Configuration for governance layer"""
 
+    # Validated once when loaded; the parsed instance is cached and shared, so
+    # it is immutable. Derive variants with model_copy(update=...), which
+    # skips revalidation
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(True, description="Master switch for governance")
 
     # NeMo Guardrails config
     nemo_enabled: bool = Field(True, description="Enable NeMo Guardrails")
     nemo_config_path: str = Field("src/governance/rails_config", description="Path to NeMo config")
+    nemo_skip_trivial_inputs: bool = Field(False, description="Skip NeMo for bare acknowledgements (ok, yes)")
 
     # PII protection config
     pii_enabled: bool = Field(True, description="Enable PII protection")
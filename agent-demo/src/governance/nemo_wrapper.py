@@ -8,17 +8,68 @@ Provides comprehensive safety checks for multi-agent systems:
 - Tool usage validation
 """
 
+import dataclasses
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from pathlib import Path
 
-from nemoguardrails import RailsConfig, LLMRails
-from nemoguardrails.rails.llm.config import Model
-
 from .models import GuardrailResult
 
+if TYPE_CHECKING:
+    # nemoguardrails pulls in LangChain; only imported when rails are initialized
+    from nemoguardrails import LLMRails
+
 logger = logging.getLogger(__name__)
 
+# Output heuristics: phrases that suggest hallucination, and off-topic
+# keywords. Each list is compiled into one case-insensitive pattern so a
+# response is scanned once per list (plain substring matches, as before)
+HALLUCINATION_MARKERS = [
+    "I don't have access to",
+    "I cannot verify",
+    "This information may not be accurate"
+]
+OFF_TOPIC_KEYWORDS = ["politics", "violence", "illegal"]
+
+_HALLUCINATION_RE = re.compile("|".join(map(re.escape, HALLUCINATION_MARKERS)), re.IGNORECASE)
+_OFF_TOPIC_RE = re.compile("|".join(map(re.escape, OFF_TOPIC_KEYWORDS)), re.IGNORECASE)
+
+# Marker the rails leave in a response when they refuse the input
+_REFUSE_RE = re.compile(r"bot refuse to respond", re.IGNORECASE)
+
+
+def _response_text(response: Any) -> str:
+    """Text of a rails response: the message content for the usual
+    {"role": ..., "content": ...} dict, the string itself, or str() otherwise"""
+    if isinstance(response, str):
+        return response
+    if isinstance(response, dict):
+        return response.get("content") or ""
+    return str(response)
+
+
+# Input verdicts kept per wrapper, keyed by a digest of the input. Evicting an
+# entry only costs a repeat rails call, never a different answer
+NEMO_INPUT_CACHE_SIZE = 1024
+
+# Tools agents may call; the sorted list is what violations report
+ALLOWED_TOOLS = frozenset({
+    "search_artists",
+    "search_venues",
+    "get_artist_details",
+    "get_venue_details"
+})
+_ALLOWED_TOOLS_LIST = sorted(ALLOWED_TOOLS)
+
+# Shared result while guardrails are disabled; input and output checks copy it
+# with the content filled in. GuardrailResult is frozen with tuple/read-only
+# mapping fields, so the copies and the tool-usage check can share it safely
+_DISABLED_RESULT = GuardrailResult(passed=True, metadata={"guardrails_disabled": True})
+
 
 class NeMoGuardrailsWrapper:
     """
@@ -37,7 +88,11 @@ class NeMoGuardrailsWrapper:
         """
         self.enabled = enabled
         self.config_path = Path(config_path)
-        self.rails: Optional[LLMRails] = None
+        self.rails: Optional["LLMRails"] = None
+        # Verdicts by input digest. Hits return the cached object itself, which
+        # is safe only because GuardrailResult is frozen (read-only fields)
+        self._input_cache: "OrderedDict[bytes, GuardrailResult]" = OrderedDict()
+        self._input_cache_lock = threading.Lock()
 
         if self.enabled:
             try:
@@ -50,6 +105,8 @@ class NeMoGuardrailsWrapper:
 
     def _initialize_rails(self):
         """Initialize the Rails configuration"""
+        from nemoguardrails import RailsConfig, LLMRails
+
         # Load configuration from path
         self.config = RailsConfig.from_path(str(self.config_path))
 
@@ -73,13 +130,14 @@ class NeMoGuardrailsWrapper:
             GuardrailResult with passed/failed status and filtered content
         """
         if not self.enabled:
-            return GuardrailResult(
-                passed=True,
-                filtered_content=user_input,
-                violations=[],
-                risk_score=0.0,
-                metadata={"guardrails_disabled": True}
-            )
+            return dataclasses.replace(_DISABLED_RESULT, filtered_content=user_input)
+
+        key = hashlib.blake2b(user_input.encode(), digest_size=16).digest()
+        with self._input_cache_lock:
+            cached = self._input_cache.get(key)
+            if cached is not None:
+                self._input_cache.move_to_end(key)
+                return cached
 
         try:
             # Use NeMo to check input
@@ -89,23 +147,29 @@ class NeMoGuardrailsWrapper:
             response = self.rails.generate(messages=messages)
 
             # Check if input was blocked
-            if response and "bot refuse to respond" in str(response).lower():
-                return GuardrailResult(
+            if response and _REFUSE_RE.search(_response_text(response)):
+                result = GuardrailResult(
                     passed=False,
                     filtered_content=None,
                     violations=["Input blocked by safety rails"],
                     risk_score=0.9,
                     metadata={"response": str(response)}
                 )
+            else:
+                # Input passed
+                result = GuardrailResult(
+                    passed=True,
+                    filtered_content=user_input,
+                    violations=[],
+                    risk_score=0.0,
+                    metadata={"checked_by": "nemo_guardrails"}
+                )
 
-            # Input passed
-            return GuardrailResult(
-                passed=True,
-                filtered_content=user_input,
-                violations=[],
-                risk_score=0.0,
-                metadata={"checked_by": "nemo_guardrails"}
-            )
+            with self._input_cache_lock:
+                self._input_cache[key] = result
+                if len(self._input_cache) > NEMO_INPUT_CACHE_SIZE:
+                    self._input_cache.popitem(last=False)
+            return result
 
         except Exception as e:
             logger.error(f"Error checking input with NeMo: {e}")
@@ -135,13 +199,7 @@ class NeMoGuardrailsWrapper:
             GuardrailResult with passed/failed status
         """
         if not self.enabled:
-            return GuardrailResult(
-                passed=True,
-                filtered_content=agent_output,
-                violations=[],
-                risk_score=0.0,
-                metadata={"guardrails_disabled": True}
-            )
+            return dataclasses.replace(_DISABLED_RESULT, filtered_content=agent_output)
 
         try:
             # For output checking, we validate the response
@@ -152,19 +210,12 @@ class NeMoGuardrailsWrapper:
             risk_score = 0.0
 
             # Check for potential hallucination markers
-            hallucination_markers = [
-                "I don't have access to",
-                "I cannot verify",
-                "This information may not be accurate"
-            ]
-
-            if any(marker.lower() in agent_output.lower() for marker in hallucination_markers):
+            if _HALLUCINATION_RE.search(agent_output):
                 violations.append("Potential hallucination detected")
                 risk_score = 0.3
 
             # Check for off-topic content
-            off_topic_keywords = ["politics", "violence", "illegal"]
-            if any(keyword in agent_output.lower() for keyword in off_topic_keywords):
+            if _OFF_TOPIC_RE.search(agent_output):
                 violations.append("Off-topic content detected")
                 risk_score = max(risk_score, 0.7)
 
@@ -201,29 +252,15 @@ class NeMoGuardrailsWrapper:
             GuardrailResult indicating if tool usage is allowed
         """
         if not self.enabled:
-            return GuardrailResult(
-                passed=True,
-                filtered_content=None,
-                violations=[],
-                risk_score=0.0,
-                metadata={"guardrails_disabled": True}
-            )
-
-        # Define allowed tools for this agent system
-        allowed_tools = {
-            "search_artists",
-            "search_venues",
-            "get_artist_details",
-            "get_venue_details"
-        }
+            return _DISABLED_RESULT
 
-        if tool_name not in allowed_tools:
+        if tool_name not in ALLOWED_TOOLS:
             return GuardrailResult(
                 passed=False,
                 filtered_content=None,
                 violations=[f"Tool '{tool_name}' not in allowed list"],
                 risk_score=1.0,
-                metadata={"allowed_tools": list(allowed_tools)}
+                metadata={"allowed_tools": _ALLOWED_TOOLS_LIST}
             )
 
         # Additional param validation could go here
@@ -241,5 +278,6 @@ class NeMoGuardrailsWrapper:
         return {
             "enabled": self.enabled,
             "config_path": str(self.config_path),
-            "rails_loaded": self.rails is not None
+            "rails_loaded": self.rails is not None,
+            "input_cache_size": len(self._input_cache)
         }
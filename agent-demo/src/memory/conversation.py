@@ -1,5 +1,7 @@
 """Conversation history management."""
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -12,6 +14,9 @@ from src.models.trace import TraceEventType
 
 logger = get_logger("memory.conversation")
 
+# Roles included in the history sent to the API
+_API_ROLES = (MessageRole.USER, MessageRole.ASSISTANT)
+
 
 @dataclass
 class Conversation:
@@ -20,6 +25,12 @@ class Conversation:
     messages: list[Message] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
 
+    # API-format dict for each message in `messages`, built once when the
+    # message is added (None for roles the API history leaves out). Only
+    # add_message appends, so the two lists stay aligned
+    _api_cache: list[dict[str, str] | None] = field(default_factory=list, init=False, repr=False)
+    _api_roles_only: bool = field(default=True, init=False, repr=False)
+
     def add_message(self, role: MessageRole, content: str, metadata: dict[str, Any] | None = None) -> Message:
         """Add a message to the conversation."""
         message = Message(
@@ -28,6 +39,11 @@ class Conversation:
             metadata=metadata or {}
         )
         self.messages.append(message)
+        if role in _API_ROLES:
+            self._api_cache.append(message.to_api_format())
+        else:
+            self._api_cache.append(None)
+            self._api_roles_only = False
         return message
 
     def get_recent_messages(self, limit: int | None = None) -> list[Message]:
@@ -36,13 +52,28 @@ class Conversation:
         return self.messages[-effective_limit:]
 
     def to_api_messages(self, limit: int | None = None) -> list[dict[str, str]]:
-        """Convert to Anthropic API format."""
-        messages = self.get_recent_messages(limit)
-        return [
-            msg.to_api_format()
-            for msg in messages
-            if msg.role in (MessageRole.USER, MessageRole.ASSISTANT)
-        ]
+        """Convert to Anthropic API format.
+
+        Returns the cached per-message dicts; callers must not mutate them.
+        """
+        effective_limit = limit or settings.conversation_history_limit
+        recent = self._api_cache[-effective_limit:]
+        if self._api_roles_only:
+            return recent
+        return [msg for msg in recent if msg is not None]
+
+    def api_history(self) -> list[dict[str, str]]:
+        """All messages before the latest one, in Anthropic API format.
+
+        Not capped at conversation_history_limit: agents trim the history
+        themselves, keeping a stable prefix for prompt caching, so they need
+        the whole of it. Returns the cached per-message dicts; callers must
+        not mutate them.
+        """
+        history = self._api_cache[:-1]
+        if self._api_roles_only:
+            return history
+        return [msg for msg in history if msg is not None]
 
     def get_message_count(self) -> int:
         """Get total message count."""
@@ -53,14 +84,31 @@ class ConversationMemory:
     """Manages conversation history across sessions."""
 
     def __init__(self):
-        self._conversations: dict[str, Conversation] = {}
+        # Kept in least-recently-used order and capped at
+        # settings.max_conversations; the oldest conversation is evicted first
+        self._conversations: OrderedDict[str, Conversation] = OrderedDict()
+        # The orchestrator (and this memory) is shared across UI sessions;
+        # guards the LRU reorder/evict sequence and iteration
+        self._lock = threading.Lock()
 
     def get_or_create(self, conversation_id: str) -> Conversation:
         """Get existing conversation or create new one."""
-        if conversation_id not in self._conversations:
-            self._conversations[conversation_id] = Conversation(conversation_id)
+        evicted = []
+        with self._lock:
+            conv = self._conversations.get(conversation_id)
+            if conv is not None:
+                self._conversations.move_to_end(conversation_id)
+                return conv
+
+            conv = self._conversations[conversation_id] = Conversation(conversation_id)
+            while len(self._conversations) > settings.max_conversations:
+                evicted.append(self._conversations.popitem(last=False)[0])
+
+        if logger.debug_enabled:
             logger.debug(f"Created new conversation", conversation_id=conversation_id)
-        return self._conversations[conversation_id]
+            for evicted_id in evicted:
+                logger.debug("Evicted conversation", conversation_id=evicted_id)
+        return conv
 
     def add_user_message(
         self,
@@ -82,11 +130,12 @@ class ConversationMemory:
             }
         )
 
-        logger.debug(
-            "Added user message",
-            conversation_id=conversation_id,
-            message_id=message.message_id
-        )
+        if logger.debug_enabled:
+            logger.debug(
+                "Added user message",
+                conversation_id=conversation_id,
+                message_id=message.message_id
+            )
 
         return message
 
@@ -110,17 +159,19 @@ class ConversationMemory:
             }
         )
 
-        logger.debug(
-            "Added assistant message",
-            conversation_id=conversation_id,
-            message_id=message.message_id
-        )
+        if logger.debug_enabled:
+            logger.debug(
+                "Added assistant message",
+                conversation_id=conversation_id,
+                message_id=message.message_id
+            )
 
         return message
 
     def get_api_messages(self, conversation_id: str, limit: int | None = None) -> list[dict]:
         """Get messages in API format."""
-        if conversation_id not in self._conversations:
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
             return []
 
         tracer.record_event(
@@ -132,7 +183,24 @@ class ConversationMemory:
             }
         )
 
-        return self._conversations[conversation_id].to_api_messages(limit)
+        return conv.to_api_messages(limit)
+
+    def get_history(self, conversation_id: str) -> list[dict]:
+        """Get the untrimmed API-format history before the latest message."""
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
+            return []
+
+        tracer.record_event(
+            TraceEventType.MEMORY_READ.value,
+            "conversation_memory",
+            {
+                "operation": "get_history",
+                "conversation_id": conversation_id
+            }
+        )
+
+        return conv.api_history()
 
     def get_conversation(self, conversation_id: str) -> Conversation | None:
         """Get conversation by ID."""
@@ -140,10 +208,12 @@ class ConversationMemory:
 
     def clear_conversation(self, conversation_id: str) -> None:
         """Clear a conversation's history."""
-        if conversation_id in self._conversations:
-            del self._conversations[conversation_id]
+        with self._lock:
+            removed = self._conversations.pop(conversation_id, None)
+        if removed is not None:
             logger.info("Cleared conversation", conversation_id=conversation_id)
 
     def get_all_conversation_ids(self) -> list[str]:
         """Get list of all conversation IDs."""
-        return list(self._conversations.keys())
+        with self._lock:
+            return list(self._conversations.keys())
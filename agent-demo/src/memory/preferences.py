@@ -1,9 +1,13 @@
 """User preference persistence."""
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from src.config.settings import settings
+
 
 @dataclass
 class UserPreferences:
@@ -72,13 +76,23 @@ class PreferenceMemory:
     """Manages user preference storage."""
 
     def __init__(self):
-        self._preferences: dict[str, UserPreferences] = {}
+        # LRU order, capped at settings.max_user_preferences
+        self._preferences: OrderedDict[str, UserPreferences] = OrderedDict()
+        # Shared across UI sessions; guards the LRU reorder/evict and iteration
+        self._lock = threading.Lock()
 
     def get_or_create(self, user_id: str) -> UserPreferences:
         """Get existing preferences or create new ones."""
-        if user_id not in self._preferences:
-            self._preferences[user_id] = UserPreferences(user_id=user_id)
-        return self._preferences[user_id]
+        with self._lock:
+            prefs = self._preferences.get(user_id)
+            if prefs is not None:
+                self._preferences.move_to_end(user_id)
+                return prefs
+
+            prefs = self._preferences[user_id] = UserPreferences(user_id=user_id)
+            while len(self._preferences) > settings.max_user_preferences:
+                self._preferences.popitem(last=False)
+            return prefs
 
     def update_from_query(self, user_id: str, extracted_info: dict[str, Any]) -> None:
         """Update preferences from extracted query information."""
@@ -103,9 +117,10 @@ class PreferenceMemory:
 
     def get_context(self, user_id: str) -> str:
         """Get preference context string for prompts."""
-        if user_id not in self._preferences:
+        prefs = self._preferences.get(user_id)
+        if prefs is None:
             return "No known preferences."
-        return self._preferences[user_id].to_context_string()
+        return prefs.to_context_string()
 
     def get_preferences(self, user_id: str) -> UserPreferences | None:
         """Get user preferences object."""
@@ -113,9 +128,10 @@ class PreferenceMemory:
 
     def clear_preferences(self, user_id: str) -> None:
         """Clear preferences for a user."""
-        if user_id in self._preferences:
-            del self._preferences[user_id]
+        with self._lock:
+            self._preferences.pop(user_id, None)
 
     def get_all_user_ids(self) -> list[str]:
         """Get list of all user IDs with stored preferences."""
-        return list(self._preferences.keys())
+        with self._lock:
+            return list(self._preferences.keys())
@@ -1,9 +1,13 @@
 """Working memory for multi-step task execution."""
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from src.config.settings import settings
+
 
 @dataclass
 class WorkingContext:
@@ -48,12 +52,20 @@ class WorkingMemory:
     """Manages working memory for active tasks."""
 
     def __init__(self):
-        self._contexts: dict[str, WorkingContext] = {}
+        # Insertion order, capped at settings.max_working_contexts so contexts
+        # that are never cleaned up do not accumulate
+        self._contexts: OrderedDict[str, WorkingContext] = OrderedDict()
+        # Shared across UI sessions; guards insert/evict and iteration
+        self._lock = threading.Lock()
 
     def create_context(self, context_id: str, user_query: str) -> WorkingContext:
         """Create a new working context."""
         context = WorkingContext(context_id=context_id, user_query=user_query)
-        self._contexts[context_id] = context
+        with self._lock:
+            self._contexts[context_id] = context
+            self._contexts.move_to_end(context_id)
+            while len(self._contexts) > settings.max_working_contexts:
+                self._contexts.popitem(last=False)
         return context
 
     def get_context(self, context_id: str) -> WorkingContext | None:
@@ -62,20 +74,23 @@ class WorkingMemory:
 
     def store_result(self, context_id: str, key: str, value: Any) -> None:
         """Store an intermediate result in a context."""
-        if context_id in self._contexts:
-            self._contexts[context_id].set_result(key, value)
+        context = self._contexts.get(context_id)
+        if context is not None:
+            context.set_result(key, value)
 
     def get_result(self, context_id: str, key: str) -> Any:
         """Retrieve an intermediate result from a context."""
-        if context_id in self._contexts:
-            return self._contexts[context_id].get_result(key)
+        context = self._contexts.get(context_id)
+        if context is not None:
+            return context.get_result(key)
         return None
 
     def cleanup(self, context_id: str) -> None:
         """Remove a working context."""
-        if context_id in self._contexts:
-            del self._contexts[context_id]
+        with self._lock:
+            self._contexts.pop(context_id, None)
 
     def get_all_contexts(self) -> dict[str, WorkingContext]:
         """Get all active contexts."""
-        return self._contexts.copy()
+        with self._lock:
+            return self._contexts.copy()
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 from datetime import datetime
-import uuid
+import secrets
 
 
 class MessageRole(Enum):
@@ -15,18 +15,24 @@ class MessageRole(Enum):
     TOOL_RESULT = "tool_result"
 
 
+# API role for each message role; tool results are sent back as user turns
+_ROLE_API = {
+    MessageRole.USER: "user",
+    MessageRole.ASSISTANT: "assistant",
+    MessageRole.SYSTEM: "system",
+    MessageRole.TOOL_RESULT: "user",
+}
+
+
 @dataclass
 class Message:
     """Represents a single message in a conversation."""
     role: MessageRole
     content: str
     timestamp: datetime = field(default_factory=datetime.now)
-    message_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    message_id: str = field(default_factory=lambda: secrets.token_hex(8))
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def to_api_format(self) -> dict[str, str]:
         """Convert to Anthropic API format."""
-        return {
-            "role": self.role.value if self.role != MessageRole.TOOL_RESULT else "user",
-            "content": self.content
-        }
+        return {"role": _ROLE_API[self.role], "content": self.content}
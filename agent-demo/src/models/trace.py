@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 from datetime import datetime
-import uuid
+import secrets
 
 
 class TraceEventType(Enum):
@@ -28,7 +28,7 @@ class TraceEvent:
     agent_name: str
     data: dict[str, Any]
     timestamp: datetime = field(default_factory=datetime.now)
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=lambda: secrets.token_hex(8))
     parent_event_id: str | None = None
     duration_ms: float | None = None
 
@@ -48,7 +48,7 @@ class TraceEvent:
 @dataclass
 class Trace:
     """Complete execution trace for a request."""
-    trace_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    trace_id: str = field(default_factory=lambda: secrets.token_hex(8))
     events: list[TraceEvent] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.now)
     end_time: datetime | None = None
@@ -0,0 +1,116 @@
+"""Exact-match cache for LLM responses.
+
+Identical (model, max_tokens, system, tools, messages) requests return the
+stored response instead of calling the API again. Intended for dev/test runs
+that replay the same conversations; enable with ENABLE_LLM_CACHE.
+"""
+
+import hashlib
+import pickle
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Protocol
+
+import orjson
+
+from src.config.settings import settings
+
+
+def _encode_default(obj: Any) -> Any:
+    """Fallback encoder for SDK content blocks in assistant messages."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def make_cache_key(
+    model: str,
+    max_tokens: int,
+    system: str,
+    tools: list[dict[str, Any]],
+    messages: list[dict[str, Any]]
+) -> str:
+    """Build a stable content hash for an LLM request."""
+    payload = orjson.dumps(
+        {
+            "model": model,
+            "max_tokens": max_tokens,
+            "system": system,
+            "tools": tools,
+            "messages": messages
+        },
+        default=_encode_default,
+        option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class LLMCacheBackend(Protocol):
+    """Storage interface for cached LLM responses."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached response for key, or None on a miss."""
+        ...
+
+    def set(self, key: str, response: Any) -> None:
+        """Store a response under key."""
+        ...
+
+
+class InMemoryLLMCache:
+    """Thread-safe in-process LRU cache of LLM responses."""
+
+    def __init__(self, max_entries: int = 256):
+        self._lock = Lock()
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: Any) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisLLMCache:
+    """Redis-backed cache so several dev processes can share responses."""
+
+    def __init__(self, client: Any, ttl_seconds: int = 86400, prefix: str = "booker:llm:"):
+        """Initialize the Redis cache.
+
+        Args:
+            client: A redis.Redis instance
+            ttl_seconds: Expiry for cached responses
+            prefix: Key prefix for cache entries
+        """
+        self._client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached response for key, or None on a miss."""
+        raw = self._client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, response: Any) -> None:
+        """Store a response under key with the configured TTL."""
+        self._client.set(self.prefix + key, pickle.dumps(response), ex=self.ttl_seconds)
+
+
+# Global cache instance; swap for a RedisLLMCache to share across processes
+llm_cache: LLMCacheBackend = InMemoryLLMCache(settings.llm_cache_max_entries)
@@ -1,11 +1,15 @@
 """Structured logging for the agent system."""
 
+import atexit
 import logging
-import json
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 from contextvars import ContextVar
 
+import orjson
+
 from src.config.settings import settings
 
 # Context variable for log context
@@ -15,21 +19,75 @@ _log_context: ContextVar[dict[str, Any]] = ContextVar("log_context", default={})
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured output."""
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # ISO date/time of the last whole second seen; most lines in a burst
+        # share it and only append milliseconds
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """Local ISO timestamp with millisecond precision."""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = datetime.fromtimestamp(second).isoformat()
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int(created * 1000) % 1000:03d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            **_log_context.get()
+            **getattr(record, "log_context", _log_context.get())
         }
 
         # Add extra data if present
         if hasattr(record, "extra_data"):
             log_data.update(record.extra_data)
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue handler that keeps records intact for the structured formatter.
+
+    The stock QueueHandler formats each record in the calling thread; this one
+    only captures the caller's log context (a ContextVar the listener thread
+    cannot see) and resolves %-args, leaving the JSON formatting to the
+    listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Capture the caller's context before the record is queued."""
+        record.log_context = _log_context.get()
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+# All loggers enqueue records; one listener thread formats and writes them
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(StructuredFormatter())
+_queue_handler = ContextQueueHandler(_log_queue)
+_listener = QueueListener(_log_queue, _stream_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+
+def route_to_queue(name: str) -> None:
+    """Send a stdlib logger's records through the shared log queue.
+
+    Args:
+        name: Logger name; its child loggers are covered via propagation
+    """
+    std_logger = logging.getLogger(name)
+    if _queue_handler not in std_logger.handlers:
+        std_logger.addHandler(_queue_handler)
 
 
 class AgentLogger:
@@ -42,42 +100,39 @@ class AgentLogger:
     def _setup_handler(self) -> None:
         """Setup handler with structured formatter."""
         if not self._logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(StructuredFormatter())
-            self._logger.addHandler(handler)
+            self._logger.addHandler(_queue_handler)
             self._logger.setLevel(getattr(logging, settings.log_level.upper()))
 
-    def info(self, message: str, **kwargs: Any) -> None:
-        """Log info message with structured data."""
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug records would be emitted; lets hot paths skip building them."""
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def _log(self, level: int, message: str, extra_data: dict[str, Any]) -> None:
+        """Build and dispatch a record, skipping all work below the logger's level."""
+        if not self._logger.isEnabledFor(level):
+            return
         record = self._logger.makeRecord(
-            self._logger.name, logging.INFO, "(unknown)", 0, message, (), None
+            self._logger.name, level, "(unknown)", 0, message, (), None
         )
-        record.extra_data = kwargs
+        record.extra_data = extra_data
         self._logger.handle(record)
 
+    def info(self, message: str, **kwargs: Any) -> None:
+        """Log info message with structured data."""
+        self._log(logging.INFO, message, kwargs)
+
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message with structured data."""
-        record = self._logger.makeRecord(
-            self._logger.name, logging.DEBUG, "(unknown)", 0, message, (), None
-        )
-        record.extra_data = kwargs
-        self._logger.handle(record)
+        self._log(logging.DEBUG, message, kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log error message with structured data."""
-        record = self._logger.makeRecord(
-            self._logger.name, logging.ERROR, "(unknown)", 0, message, (), None
-        )
-        record.extra_data = kwargs
-        self._logger.handle(record)
+        self._log(logging.ERROR, message, kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message with structured data."""
-        record = self._logger.makeRecord(
-            self._logger.name, logging.WARNING, "(unknown)", 0, message, (), None
-        )
-        record.extra_data = kwargs
-        self._logger.handle(record)
+        self._log(logging.WARNING, message, kwargs)
 
     @staticmethod
     def set_context(**kwargs: Any) -> None:
@@ -92,6 +147,13 @@ class AgentLogger:
         _log_context.set({})
 
 
+# One AgentLogger per name, shared by every get_logger caller
+_loggers: dict[str, AgentLogger] = {}
+
+
 def get_logger(name: str) -> AgentLogger:
     """Get a logger instance for a module."""
-    return AgentLogger(name)
+    agent_logger = _loggers.get(name)
+    if agent_logger is None:
+        agent_logger = _loggers.setdefault(name, AgentLogger(name))
+    return agent_logger
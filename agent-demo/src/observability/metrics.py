@@ -55,6 +55,12 @@ class SessionMetrics:
         """Total tokens (in + out)."""
         return self.total_tokens_in + self.total_tokens_out
 
+    @property
+    def output_ratio(self) -> float | None:
+        """Output tokens as a percentage of all tokens, None before any usage."""
+        total = self.total_tokens
+        return self.total_tokens_out / total * 100 if total > 0 else None
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for display."""
         return {
@@ -64,6 +70,7 @@ class SessionMetrics:
             "total_tokens_in": self.total_tokens_in,
             "total_tokens_out": self.total_tokens_out,
             "total_tokens": self.total_tokens,
+            "output_ratio": self.output_ratio,
             "agents": {
                 name: metrics.to_dict()
                 for name, metrics in self.agent_metrics.items()
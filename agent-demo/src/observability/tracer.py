@@ -13,6 +13,8 @@ from opentelemetry.sdk.resources import Resource
 from contextlib import contextmanager
 from typing import Any
 
+from src.config.settings import settings
+
 # Initialize provider
 _resource = Resource.create({"service.name": "booker-agents"})
 _provider = TracerProvider(resource=_resource)
@@ -31,8 +33,14 @@ _tracer = trace.get_tracer("booker.agents")
 class Tracer:
     """OpenTelemetry-based tracer with API compatible with existing code."""
 
+    def __init__(self, enabled: bool = True):
+        # Hot call sites check this before building event payloads
+        self.enabled = enabled
+
     def record_event(self, event_type: str, agent_name: str, data: dict[str, Any]):
         """Record an event as a span event on the current span."""
+        if not self.enabled:
+            return
         span = trace.get_current_span()
         if span.is_recording():
             span.add_event(event_type, attributes={
@@ -40,17 +48,30 @@ class Tracer:
                 **{k: str(v)[:100] for k, v in data.items()}
             })
 
-    def record_tokens(self, tokens_in: int, tokens_out: int):
-        """Record token usage on current span."""
+    def record_tokens(
+        self,
+        tokens_in: int,
+        tokens_out: int,
+        cache_creation: int = 0,
+        cache_read: int = 0
+    ):
+        """Record token usage (including prompt-cache usage) on current span."""
+        if not self.enabled:
+            return
         span = trace.get_current_span()
         if span.is_recording():
             span.set_attribute("tokens.in", tokens_in)
             span.set_attribute("tokens.out", tokens_out)
             span.set_attribute("tokens.total", tokens_in + tokens_out)
+            span.set_attribute("tokens.cache_creation", cache_creation)
+            span.set_attribute("tokens.cache_read", cache_read)
 
     @contextmanager
     def timed_event(self, event_type: str, agent_name: str, data: dict[str, Any]):
         """Context manager that creates a child span."""
+        if not self.enabled:
+            yield trace.INVALID_SPAN
+            return
         with _tracer.start_as_current_span(f"{agent_name}.{event_type}") as span:
             for k, v in data.items():
                 span.set_attribute(k, str(v)[:100])
@@ -59,6 +80,9 @@ class Tracer:
     @contextmanager
     def trace_request(self, session_id: str, user_input: str):
         """Start a new trace for a user request."""
+        if not self.enabled:
+            yield trace.INVALID_SPAN
+            return
         with _tracer.start_as_current_span("request") as span:
             span.set_attribute("session_id", session_id)
             span.set_attribute("input_length", len(user_input))
@@ -132,4 +156,4 @@ class Tracer:
 
 
 # Global instance (matches existing API)
-tracer = Tracer()
+tracer = Tracer(enabled=settings.enable_tracing)
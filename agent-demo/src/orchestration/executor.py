@@ -1,9 +1,12 @@
 """Main orchestration executor for the multi-agent system."""
 
-from typing import Any
+from typing import Any, Iterator
+import queue
+import threading
 import uuid
 import time
 
+from src.agents.base import stream_text
 from src.agents.coordinator import CoordinatorAgent
 from src.agents.artist_discovery import ArtistDiscoveryAgent
 from src.agents.venue_matching import VenueMatchingAgent
@@ -18,6 +21,58 @@ from src.observability.logger import get_logger
 logger = get_logger("orchestration")
 
 
+class MessageStream:
+    """Iterable of response text chunks for a single user message.
+
+    Text is yielded as the agents generate it. A None item means the text
+    yielded so far was not the final answer (it preceded a routing decision or
+    tool call) and should be cleared. Once iteration finishes, ``result``
+    holds the same dictionary that process_message returns; its ``content``
+    is the authoritative response text.
+    """
+
+    def __init__(
+        self,
+        orchestrator: "AgentOrchestrator",
+        user_message: str,
+        session_id: str,
+        user_id: str | None = None
+    ):
+        self._orchestrator = orchestrator
+        self._user_message = user_message
+        self._session_id = session_id
+        self._user_id = user_id
+        self.result: dict[str, Any] | None = None
+
+    def __iter__(self) -> Iterator[str | None]:
+        chunks: queue.Queue = queue.Queue()
+        done = object()
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                with stream_text(chunks.put):
+                    self.result = self._orchestrator.process_message(
+                        self._user_message,
+                        self._session_id,
+                        self._user_id
+                    )
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                chunks.put(done)
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+
+        while (chunk := chunks.get()) is not done:
+            yield chunk
+
+        worker.join()
+        if errors:
+            raise errors[0]
+
+
 class AgentOrchestrator:
     """Coordinates the multi-agent system with memory and observability."""
 
@@ -75,8 +130,9 @@ class AgentOrchestrator:
             # Build context from preferences and memory
             context = self._build_context(session_id, user_id)
 
-            # Get conversation history (excluding current message)
-            history = self.conversation_memory.get_api_messages(session_id)[:-1]
+            # Get conversation history (excluding current message); agents cap
+            # it themselves so the kept prefix stays stable between turns
+            history = self.conversation_memory.get_history(session_id)
 
             # Process through coordinator
             try:
@@ -153,6 +209,26 @@ class AgentOrchestrator:
                     "success": False
                 }
 
+    def process_message_stream(
+        self,
+        user_message: str,
+        session_id: str,
+        user_id: str | None = None
+    ) -> MessageStream:
+        """Process a user message, streaming response text as it is generated.
+
+        Args:
+            user_message: The user's input message
+            session_id: Session identifier for conversation tracking
+            user_id: Optional user identifier for preference tracking
+
+        Returns:
+            MessageStream yielding text chunks (None to clear the text so
+            far); its ``result`` attribute holds the process_message
+            dictionary once iteration completes
+        """
+        return MessageStream(self, user_message, session_id, user_id)
+
     def _build_context(self, session_id: str, user_id: str | None) -> dict[str, Any]:
         """Build context dictionary from memory systems.
 
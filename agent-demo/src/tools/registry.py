@@ -237,14 +237,74 @@ _TOOL_REGISTRY: dict[str, Callable] = {
 }
 
 
+def _invoke(func: Callable, tool_input: dict[str, Any]) -> Any:
+    """Call a tool function, turning failures into an error result."""
+    try:
+        return func(**tool_input)
+    except Exception as e:
+        return {"error": f"Tool execution failed: {e}"}
+
+
 def execute_tool(tool_name: str, tool_input: dict[str, Any]) -> Any:
     """Execute a tool by name. Used by agents and MCP server."""
     if tool_name not in _TOOL_REGISTRY:
         return {"error": f"Unknown tool: {tool_name}"}
-    try:
-        return _TOOL_REGISTRY[tool_name](**tool_input)
-    except Exception as e:
-        return {"error": f"Tool execution failed: {e}"}
+    return _invoke(_TOOL_REGISTRY[tool_name], tool_input)
+
+
+def bind_tool(tool_name: str) -> Callable[[dict[str, Any]], Any]:
+    """Resolve a tool once, for callers that execute it repeatedly.
+
+    Args:
+        tool_name: Registered tool name
+
+    Returns:
+        Callable taking the tool input, with the same error handling as
+        execute_tool
+    """
+    func = _TOOL_REGISTRY.get(tool_name)
+    if func is None:
+        return lambda tool_input: {"error": f"Unknown tool: {tool_name}"}
+    return lambda tool_input: _invoke(func, tool_input)
+
+
+# Fields the agents need from each search tool's records. Anything else a
+# backend adds is dropped before results are sent back to the LLM. Detail
+# tools are not listed and keep their full record.
+TOOL_RESULT_PROJECTIONS: dict[str, frozenset[str]] = {
+    "search_artists": frozenset(
+        {"id", "name", "genres", "location", "typical_venue_capacity"}
+    ),
+    "semantic_search_artists": frozenset(
+        {"id", "name", "genres", "location", "typical_venue_capacity", "search_score"}
+    ),
+    "search_venues": frozenset(
+        {"id", "name", "location", "capacity", "genres_booked", "venue_type"}
+    ),
+    "semantic_search_venues": frozenset(
+        {"id", "name", "location", "capacity", "genres_booked", "venue_type", "search_score"}
+    ),
+}
+
+
+def project_tool_result(tool_name: str, result: Any) -> Any:
+    """Keep only the allowlisted fields of a tool's result records.
+
+    Args:
+        tool_name: Name of the tool that produced the result
+        result: Raw tool result
+
+    Returns:
+        Result with each record trimmed to its projection; results of tools
+        without a projection, and non-list results (e.g. errors), unchanged
+    """
+    fields = TOOL_RESULT_PROJECTIONS.get(tool_name)
+    if fields is None or not isinstance(result, list):
+        return result
+    return [
+        {k: v for k, v in record.items() if k in fields} if isinstance(record, dict) else record
+        for record in result
+    ]
 
 
 def register_tool(name: str, func: Callable) -> None:
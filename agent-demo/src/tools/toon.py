@@ -0,0 +1,104 @@
+"""Compact TOON-style encoding for tool results sent back to the LLM.
+
+Search tools return lists of records that all share the same keys. JSON
+repeats every key on every record; the tabular form below states the fields
+once and emits one comma-separated row per record:
+
+    [2]{id,name,genres}:
+      artist_1,The Midnight Riders,Rock|Indie
+      artist_2,"Chen, Sarah",Folk
+
+Multi-valued fields join their values with "|". Values that would be
+ambiguous (contain a delimiter, look like a number/bool/null, are empty,
+etc.) are written as JSON strings. Anything that is not a flat, homogeneous
+list of records, or whose field names are not plain identifiers, is encoded
+as plain JSON.
+
+The table does not distinguish a one-element list from its lone value:
+["Rock"] and "Rock" both encode as Rock. An empty list is an empty cell,
+which is distinct from an empty string (written as "").
+"""
+
+import re
+from typing import Any
+
+import orjson
+
+# Strings matching this would read back as a number, bool or null
+_AMBIGUOUS = re.compile(r"^(true|false|null|-?\d+(\.\d+)?([eE][+-]?\d+)?)$")
+
+# Field names written into the header unescaped
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_.-]*$")
+
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _encode_scalar(value: Any) -> str:
+    """Encode a single primitive value for a table cell."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    if (
+        not value
+        or value != value.strip()
+        or any(c in value for c in ',|"\n\r\t')
+        or _AMBIGUOUS.match(value)
+    ):
+        return orjson.dumps(value).decode()
+    return value
+
+
+def _encode_cell(value: Any) -> str | None:
+    """Encode a table cell, or return None if the value is not tabular."""
+    if isinstance(value, _PRIMITIVES):
+        return _encode_scalar(value)
+    if isinstance(value, list) and all(isinstance(v, _PRIMITIVES) for v in value):
+        return "|".join(_encode_scalar(v) for v in value)
+    return None
+
+
+def to_toon(records: list[dict[str, Any]]) -> str | None:
+    """Encode a homogeneous list of flat records as a TOON-style table.
+
+    Args:
+        records: Records that should all share the same keys
+
+    Returns:
+        The table text, or None if the records cannot be tabulated
+    """
+    if not records or not all(isinstance(r, dict) for r in records):
+        return None
+
+    fields = list(records[0])
+    if not fields or any(list(r) != fields for r in records):
+        return None
+    if not all(isinstance(f, str) and _FIELD_NAME.match(f) for f in fields):
+        return None
+
+    rows = []
+    for record in records:
+        cells = [_encode_cell(record[f]) for f in fields]
+        if any(cell is None for cell in cells):
+            return None
+        rows.append("  " + ",".join(cells))
+
+    header = f"[{len(records)}]{{{','.join(fields)}}}:"
+    return "\n".join([header, *rows])
+
+
+def encode_tool_result(result: Any) -> bytes:
+    """Encode a tool result for the LLM, preferring the tabular form.
+
+    Args:
+        result: Raw tool result
+
+    Returns:
+        UTF-8 encoded TOON table for record lists, JSON otherwise
+    """
+    if isinstance(result, list) and (table := to_toon(result)) is not None:
+        return table.encode()
+    return orjson.dumps(result, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -0,0 +1,119 @@
+"""Token-bucket rate limiting in CostController, driven by a fake clock."""
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from src.governance import cost_control  # noqa: E402
+from src.governance.cost_control import CostController  # noqa: E402
+
+
+class FakeTime:
+    """Stands in for the time module; monotonic() only moves when advanced."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(cost_control, "time", fake)
+    return fake
+
+
+def _controller(requests_per_minute: int, tokens_per_hour: int) -> CostController:
+    # Budgets far above anything the tests draw, so only the buckets deny
+    return CostController(
+        global_daily_tokens=10**9,
+        per_session_tokens=10**9,
+        per_user_daily_tokens=10**9,
+        requests_per_minute=requests_per_minute,
+        tokens_per_hour=tokens_per_hour,
+    )
+
+
+def _allowed(controller: CostController, session_id: str, tokens: int = 1) -> bool:
+    return controller.check_budget(tokens, session_id).allowed
+
+
+def test_request_bucket_refills_over_time_up_to_capacity(clock):
+    controller = _controller(requests_per_minute=60, tokens_per_hour=10**9)
+
+    assert all(_allowed(controller, "s") for _ in range(60))
+    assert not _allowed(controller, "s")
+
+    # 60/minute refills one request per second
+    clock.advance(1.0)
+    assert _allowed(controller, "s")
+    assert not _allowed(controller, "s")
+
+    # A long idle period refills to capacity, not beyond
+    clock.advance(3600.0)
+    assert all(_allowed(controller, "s") for _ in range(60))
+    assert not _allowed(controller, "s")
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    controller = _controller(requests_per_minute=10**6, tokens_per_hour=3600)
+
+    assert _allowed(controller, "s", tokens=3600)
+    assert not _allowed(controller, "s", tokens=1)
+
+    # 3600/hour refills one token per second
+    clock.advance(10.0)
+    assert not _allowed(controller, "s", tokens=11)
+    assert _allowed(controller, "s", tokens=10)
+
+    clock.advance(10 * 3600.0)
+    assert not _allowed(controller, "s", tokens=3601)
+    assert _allowed(controller, "s", tokens=3600)
+
+
+def test_token_denial_does_not_draw_request_bucket(clock):
+    controller = _controller(requests_per_minute=2, tokens_per_hour=100)
+
+    denied = controller.check_budget(101, "s")
+    assert not denied.allowed
+    assert "tokens per hour" in denied.reason
+
+    # Both requests are still available
+    assert _allowed(controller, "s")
+    assert _allowed(controller, "s")
+    assert not _allowed(controller, "s")
+
+
+def test_request_denial_does_not_draw_token_bucket(clock):
+    controller = _controller(requests_per_minute=1, tokens_per_hour=100)
+
+    assert _allowed(controller, "a", tokens=10)
+    denied = controller.check_budget(50, "a")
+    assert not denied.allowed
+    assert "requests per minute" in denied.reason
+
+    # The denied request's 50 tokens were not taken: 90 remain
+    assert _allowed(controller, "b", tokens=90)
+
+
+def test_request_buckets_evict_least_recently_used_session(clock, monkeypatch):
+    monkeypatch.setattr(cost_control, "_MAX_TRACKED_KEYS", 2)
+    controller = _controller(requests_per_minute=1, tokens_per_hour=10**9)
+
+    assert _allowed(controller, "a")
+    assert _allowed(controller, "b")
+    assert _allowed(controller, "c")
+    assert list(controller._request_buckets) == ["b", "c"]
+
+    # "b" is still tracked with an empty bucket; evicted "a" starts over full
+    assert not _allowed(controller, "b")
+    assert _allowed(controller, "a")
+    assert list(controller._request_buckets) == ["c", "a"]
@@ -0,0 +1,64 @@
+"""Conversation history flows untrimmed from memory into the agent's block trim."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("CLAUDE_API_KEY", "test-key")
+
+pytest.importorskip("anthropic")
+pytest.importorskip("opentelemetry")
+
+from src.agents.base import _trim_history  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.memory.conversation import ConversationMemory  # noqa: E402
+
+LIMIT = settings.conversation_history_limit
+
+
+def _histories(turns: int) -> list[list[dict]]:
+    """Trimmed history the agent would send on each turn, as the executor builds it."""
+    memory = ConversationMemory()
+    trimmed = []
+    for turn in range(turns):
+        memory.add_user_message("s", f"u{turn}")
+        trimmed.append(_trim_history(memory.get_history("s"), LIMIT))
+        memory.add_assistant_message("s", f"a{turn}")
+    return trimmed
+
+
+def test_get_history_is_untrimmed_and_excludes_current_message():
+    memory = ConversationMemory()
+    turns = LIMIT
+    for turn in range(turns):
+        memory.add_user_message("s", f"u{turn}")
+        memory.add_assistant_message("s", f"a{turn}")
+    memory.add_user_message("s", "current")
+
+    history = memory.get_history("s")
+
+    assert len(history) == 2 * turns
+    assert history[0] == {"role": "user", "content": "u0"}
+    assert history[-1] == {"role": "assistant", "content": f"a{turns - 1}"}
+
+
+def test_trim_keeps_opening_exchange_and_alternation():
+    for history in _histories(LIMIT):
+        assert len(history) <= LIMIT
+        if history:
+            assert history[0]["content"] == "u0"
+            assert history[0]["role"] == "user"
+            roles = [m["role"] for m in history]
+            assert roles == ["user", "assistant"] * (len(roles) // 2)
+
+
+def test_trim_prefix_only_changes_once_per_block():
+    # Turns where the full history (2 * turn messages) exceeds the limit
+    trimmed = _histories(LIMIT)[LIMIT // 2 + 1:]
+    assert trimmed and all(h[2]["content"] != "u1" for h in trimmed)
+
+    # The message after the kept opening exchange marks the current block;
+    # it must stay put across consecutive turns instead of sliding every turn
+    block_starts = [h[2]["content"] for h in trimmed]
+    changes = sum(1 for a, b in zip(block_starts, block_starts[1:]) if a != b)
+    assert changes < len(block_starts) // 2
@@ -0,0 +1,39 @@
+"""Import smoke tests: each module must load in a fresh interpreter.
+
+Run in a subprocess so a circular import cannot be masked by modules that an
+earlier test already imported.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Module under test -> third-party packages it needs to import
+MODULES = {
+    "src.config.settings": ["pydantic_settings", "yaml"],
+    "src.governance": ["pydantic_settings", "yaml"],
+    "src.observability.logger": ["pydantic_settings", "yaml", "orjson"],
+    "src.memory.conversation": ["pydantic_settings", "yaml", "orjson", "opentelemetry"],
+}
+
+
+@pytest.mark.parametrize("module", sorted(MODULES))
+def test_module_imports_cleanly(module: str) -> None:
+    for dependency in MODULES[module]:
+        pytest.importorskip(dependency)
+
+    env = {**os.environ, "CLAUDE_API_KEY": os.environ.get("CLAUDE_API_KEY", "test-key")}
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,99 @@
+"""TOON-style tabular encoding of tool results."""
+
+import orjson
+import pytest
+
+from src.tools.toon import encode_tool_result, to_toon
+
+
+def _rows(table: str) -> list[str]:
+    return [line.strip() for line in table.splitlines()[1:]]
+
+
+def test_table_header_and_rows():
+    table = to_toon([
+        {"id": "artist_1", "name": "The Midnight Riders", "capacity": 500},
+        {"id": "artist_2", "name": "Sarah Chen", "capacity": 1200},
+    ])
+
+    assert table.splitlines()[0] == "[2]{id,name,capacity}:"
+    assert _rows(table) == [
+        "artist_1,The Midnight Riders,500",
+        "artist_2,Sarah Chen,1200",
+    ]
+
+
+@pytest.mark.parametrize("value, cell", [
+    ("Chen, Sarah", '"Chen, Sarah"'),
+    ("Rock|Indie", '"Rock|Indie"'),
+    ('say "hi"', '"say \\"hi\\""'),
+    ("line\nbreak", '"line\\nbreak"'),
+    (" padded", '" padded"'),
+    ("", '""'),
+    ("123", '"123"'),
+    ("-4.5e3", '"-4.5e3"'),
+    ("true", '"true"'),
+    ("null", '"null"'),
+    ("plain text", "plain text"),
+])
+def test_ambiguous_strings_are_quoted(value, cell):
+    assert _rows(to_toon([{"v": value}])) == [cell]
+
+
+@pytest.mark.parametrize("value, cell", [
+    (None, "null"),
+    (True, "true"),
+    (False, "false"),
+    (42, "42"),
+    (1.5, "1.5"),
+])
+def test_primitive_cells(value, cell):
+    assert _rows(to_toon([{"v": value}])) == [cell]
+
+
+@pytest.mark.parametrize("value, cell", [
+    (["Rock", "Indie"], "Rock|Indie"),
+    (["Rock", "Hip|Hop", 3, None], 'Rock|"Hip|Hop"|3|null'),
+    # A one-element list is indistinguishable from its lone value
+    (["Rock"], "Rock"),
+    # An empty list is an empty cell; an empty string is quoted
+    ([], ""),
+    ([""], '""'),
+])
+def test_list_cells(value, cell):
+    assert _rows(to_toon([{"v": value}])) == [cell]
+
+
+@pytest.mark.parametrize("records", [
+    # Records with different keys or key order
+    [{"a": 1, "b": 2}, {"a": 1}],
+    [{"a": 1, "b": 2}, {"b": 2, "a": 1}],
+    # Nested values
+    [{"a": {"nested": 1}}],
+    [{"a": [1, [2]]}],
+    [{"a": [{"x": 1}]}],
+    # Not a list of dicts
+    [{"a": 1}, "b"],
+    [],
+    [{}],
+    # Field names that would need escaping in the header
+    [{"a,b": 1}],
+    [{"a}": 1}],
+    [{"has space": 1}],
+])
+def test_untabulatable_records_fall_back_to_json(records):
+    assert to_toon(records) is None
+    assert encode_tool_result(records) == orjson.dumps(records)
+
+
+def test_non_string_field_names_are_not_tabulated():
+    assert to_toon([{1: "x"}]) is None
+
+
+def test_encode_tool_result_prefers_table():
+    result = [{"id": "v1", "name": "Venue"}]
+    assert encode_tool_result(result) == to_toon(result).encode()
+
+
+def test_encode_tool_result_non_list_is_json():
+    assert encode_tool_result({"error": "not found"}) == b'{"error":"not found"}'